@@ -6,33 +6,84 @@ Based on nxtChat server.py pattern with contract-specific enhancements.
 """
 
 import os
+import re
+import sys
+import atexit
+import logging
+import logging.handlers
 import uuid
-import json
-import time
+from urllib.parse import unquote
 import threading
+import multiprocessing
 import queue
 from datetime import datetime
-from io import BytesIO
-import fitz  # PyMuPDF for PDF processing
-from flask import Flask, request, jsonify
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import orjson
+from flask import Flask, request, jsonify, send_file
+from flask.json.provider import DefaultJSONProvider
+from streaming_form_data import StreamingFormDataParser
+from streaming_form_data.targets import FileTarget, ValueTarget
+from werkzeug.exceptions import RequestEntityTooLarge
+from werkzeug.http import parse_options_header
 from dotenv import load_dotenv
 
 # Import Contract-Agent modules
 from core.crew.crew_manager import ContractProcessingCrew
-from core.types import CrewProcessingResult
+from core.crew.crew_manager import process_contract as run_crew_job
+from core.crew.crew_manager import init_crew_worker
 from infrastructure.storage.memory_storage import MemoryStorage
+from infrastructure.storage.job_queue import JobQueue
 from infrastructure.aws.bedrock_client import BedrockModelManager
 from core.document_processing import pdf_utils
 
 # Load environment variables
 load_dotenv()
 
+# Runtime logging from dispatcher threads and request handlers goes through a queue,
+# so a slow stdout never stalls job processing; the listener thread does the writing
+log_queue = queue.SimpleQueue()
+logger = logging.getLogger("contract_api")
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.handlers.QueueHandler(log_queue))
+logger.propagate = False
+log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+log_listener.start()
+atexit.register(log_listener.stop)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    
+    jsonify() and request.get_json() go through orjson, whose native UTF-8 writer is
+    much faster than the stdlib encoder for multi-megabyte RTF strings. datetime values
+    are serialized natively as ISO 8601; other types fall back to Flask's default hook.
+    """
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Skip the bytes -> str -> bytes round trip of the base implementation
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS),
+            mimetype=self.mimetype
+        )
+
+
 # Configure Flask with increased max content length and timeouts for large contracts
 # Use 'application' name for EB compatibility
 application = Flask(__name__)
-application.config['MAX_CONTENT_LENGTH'] = 200 * 1024 * 1024  # 200MB for large contracts
+application.config['MAX_CONTENT_LENGTH'] = int(os.getenv('MAX_CONTENT_LENGTH', 200 * 1024 * 1024))  # 200MB default for large contracts
 application.config['JSON_AS_ASCII'] = False  # Properly handle Unicode
+application.json = OrjsonProvider(application)
 application.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0  # Disable caching for large files
+FILE_TOO_LARGE_MESSAGE = f"File too large. Maximum size is {application.config['MAX_CONTENT_LENGTH'] // (1024 * 1024)}MB."
 
 # Initialize Contract-Agent components
 print("🚀 Initializing Contract-Agent API Server...")
@@ -46,31 +97,77 @@ UPLOAD_FOLDER = os.path.join(script_dir, "data", "uploads")
 RTF_OUTPUT_FOLDER = os.path.join(script_dir, "data", "generated")
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 os.makedirs(RTF_OUTPUT_FOLDER, exist_ok=True)
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # Read size when streaming multipart uploads to disk
+
+# Accepted upload types (lowercase, without the dot) and the matching error text
+ALLOWED_EXTENSIONS = frozenset(('pdf', 'txt', 'rtf'))
+SUPPORTED_EXTENSIONS_TEXT = ".pdf, .txt, .rtf"
 
-# Job processing queue and background thread
-job_queue = queue.Queue()
-processing_thread = None
+# Canonical UUID form used for job IDs; also rules out path traversal and markup
+JOB_ID_PATTERN = re.compile(r'\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z')
+
+# Job processing queue and background thread; uploads get 429 once CONTRACT_QUEUE_MAX jobs wait (0 = unbounded)
+JOB_QUEUE_MAX_SIZE = max(0, int(os.getenv('CONTRACT_QUEUE_MAX', '16')))
+job_queue = JobQueue(maxsize=JOB_QUEUE_MAX_SIZE)
+processing_threads = []
 job_lock = threading.Lock()
 
+# CrewAI jobs run in worker processes; one dispatcher thread per worker feeds them
+CREW_WORKERS = max(1, int(os.getenv('CREW_WORKERS', '4')))
+crew_pool = None
+
+# Worker processes come from a forkserver, never forked from this multithreaded process
+# (log listener, request and dispatcher threads may hold locks); the server imports the
+# crew and PDF modules once so each worker starts with them loaded
+CREW_MP_CONTEXT = multiprocessing.get_context("forkserver")
+CREW_MP_CONTEXT.set_forkserver_preload(["core.crew.crew_manager", "core.document_processing.pdf_utils"])
+
 print(f"📁 Upload folder: {UPLOAD_FOLDER}")
 print(f"📁 RTF output folder: {RTF_OUTPUT_FOLDER}")
 print(f"🔥 Bedrock integration: {bedrock_manager is not None}")
 
 
+def get_crew_pool(broken_pool=None) -> ProcessPoolExecutor:
+    """
+    Return the process pool running CrewAI jobs.
+    
+    Passing the pool that raised BrokenProcessPool replaces it, so a crashed
+    worker does not take down every later job.
+    """
+    global crew_pool
+    with job_lock:
+        if crew_pool is None or (broken_pool is not None and crew_pool is broken_pool):
+            if crew_pool is not None:
+                crew_pool.shutdown(wait=False, cancel_futures=True)
+            crew_pool = ProcessPoolExecutor(
+                max_workers=CREW_WORKERS,
+                mp_context=CREW_MP_CONTEXT,
+                initializer=init_crew_worker
+            )
+        return crew_pool
+
+
+def processing_threads_alive() -> int:
+    """Number of live job dispatcher threads"""
+    return sum(1 for thread in processing_threads if thread.is_alive())
+
+
 def start_processing_thread():
-    """Start the background job processing thread"""
-    global processing_thread
+    """Start job dispatcher threads until CREW_WORKERS are alive"""
+    global processing_threads
     
     def process_jobs():
         """Background thread function to process contract jobs"""
-        print("🔄 Contract processing thread started")
+        logger.info("🔄 Contract processing thread started")
         
         while True:
+            # Reset per iteration so a failure before the next get() never marks the previous job failed
+            job_id = None
             try:
-                # Get job from queue (blocking) - increased timeout for large contract processing
-                job_id, user_prompt, file_path, original_filename = job_queue.get(timeout=120)
+                # Wait on the queue's Event until a job arrives instead of polling with a timeout
+                job_id, user_prompt, file_path, original_filename = job_queue.get(block=True)
                 
-                print(f"📋 Processing job {job_id}: {original_filename}")
+                logger.info(f"📋 Processing job {job_id}: {original_filename}")
                 
                 # Update job status to processing
                 memory_storage.update_job_status(job_id, "processing", 10)
@@ -86,39 +183,44 @@ def start_processing_thread():
                 
                 memory_storage.update_job_status(job_id, "processing", 30)
                 
-                # Process contract with CrewAI workflow
-                print(f"🤖 Starting CrewAI processing for job {job_id}")
-                result = crew_manager.process_contract(
-                    original_rtf=original_rtf,
-                    user_prompt=user_prompt,
-                    job_id=job_id
-                )
+                # Process contract with CrewAI workflow in a worker process
+                logger.info(f"🤖 Starting CrewAI processing for job {job_id}")
+                pool = get_crew_pool()
+                try:
+                    result = pool.submit(run_crew_job, original_rtf, user_prompt, job_id).result()
+                except BrokenProcessPool:
+                    get_crew_pool(broken_pool=pool)
+                    raise
                 
-                # Store result in memory
+                # Store result in memory and persist the final RTF for /job_result/<job_id>/rtf
                 memory_storage.store_result(job_id, result)
+                if result.success and result.final_rtf:
+                    pdf_utils.save_rtf_content(result.final_rtf, rtf_output_path(job_id))
                 
                 if result.success:
                     memory_storage.update_job_status(job_id, "completed", 100)
-                    print(f"✅ Job {job_id} completed successfully")
+                    logger.info(f"✅ Job {job_id} completed successfully")
                 else:
                     memory_storage.update_job_status(
                         job_id, "failed", 0, 
                         result.error_message or "Processing failed"
                     )
-                    print(f"❌ Job {job_id} failed: {result.error_message}")
+                    logger.error(f"❌ Job {job_id} failed: {result.error_message}")
                 
                 # Clean up temporary file
-                if os.path.exists(file_path):
+                try:
                     os.remove(file_path)
+                except FileNotFoundError:
+                    pass
                     
             except queue.Empty:
                 # No jobs in queue, continue waiting
                 continue
             except Exception as e:
-                print(f"💥 Processing thread error: {e}")
+                logger.error(f"💥 Processing thread error: {e}")
                 # Mark job as failed if we have job_id
                 try:
-                    if 'job_id' in locals():
+                    if job_id is not None:
                         memory_storage.update_job_status(
                             job_id, "failed", 0, 
                             f"Processing error: {str(e)}"
@@ -126,28 +228,111 @@ def start_processing_thread():
                 except:
                     pass
     
-    processing_thread = threading.Thread(target=process_jobs, daemon=True)
-    processing_thread.start()
-    return processing_thread
+    get_crew_pool()
+    
+    with job_lock:
+        processing_threads = [thread for thread in processing_threads if thread.is_alive()]
+        while len(processing_threads) < CREW_WORKERS:
+            thread = threading.Thread(target=process_jobs, name=f"contract-worker-{len(processing_threads) + 1}", daemon=True)
+            thread.start()
+            processing_threads.append(thread)
+        return processing_threads
+
+
+def stream_upload_to_disk(upload_path: str):
+    """
+    Stream the multipart request body straight to disk.
+    
+    Parses the 'file' and 'prompt' form fields with streaming-form-data instead of
+    Werkzeug's form parser, so large contracts never pass through request.files.
+    request.stream enforces MAX_CONTENT_LENGTH and raises RequestEntityTooLarge.
+    
+    Returns:
+        Tuple of (original filename or None if no file field, prompt text)
+    """
+    if request.mimetype != 'multipart/form-data':
+        return None, ''
+    
+    file_target = FileTarget(upload_path)
+    prompt_target = ValueTarget()
+    
+    parser = StreamingFormDataParser(headers=request.headers)
+    parser.register('file', file_target)
+    parser.register('prompt', prompt_target)
+    
+    while True:
+        chunk = request.stream.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        parser.data_received(chunk)
+    
+    return file_target.multipart_filename, prompt_target.value.decode('utf-8', errors='replace')
+
+
+def stream_raw_upload_to_disk(upload_path: str):
+    """
+    Stream a raw (non-multipart) request body straight to disk.
+    
+    The filename is taken from the Content-Disposition header and the prompt from
+    the URL-encoded X-Contract-Prompt header, so the body is copied in
+    UPLOAD_CHUNK_SIZE pieces without any form parsing.
+    
+    Returns:
+        Tuple of (original filename or None if no filename was given, prompt text)
+    """
+    _, disposition = parse_options_header(request.headers.get('Content-Disposition', ''))
+    original_filename = disposition.get('filename')
+    if original_filename is None:
+        return None, ''
+    
+    with open(upload_path, 'wb') as upload_file:
+        while True:
+            chunk = request.stream.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            upload_file.write(chunk)
+    
+    return original_filename, unquote(request.headers.get('X-Contract-Prompt', ''))
+
+
+def queue_full_response():
+    """429 response for uploads arriving while JOB_QUEUE_MAX_SIZE jobs are already waiting"""
+    return jsonify({
+        "error": f"Server busy: {JOB_QUEUE_MAX_SIZE} contracts are already queued. Please retry later.",
+        "success": False
+    }), 429
+
+
+def rtf_output_path(job_id: str) -> str:
+    """Location of the persisted final RTF for a job"""
+    return os.path.join(RTF_OUTPUT_FOLDER, f"{job_id}.rtf")
+
+
+def validate_job_id(job_id: str) -> bool:
+    """Validate job ID format for security (canonical UUID only)"""
+    return isinstance(job_id, str) and JOB_ID_PATTERN.match(job_id) is not None
+
+
+def truncate_preview(text: str, limit: int) -> str:
+    """Return text cut to limit characters with an ellipsis marker when truncated"""
+    if text is None or len(text) <= limit:
+        return text
+    return text[:limit] + "..."
 
 
 def extract_text_from_file(file_path: str) -> str:
     """Extract text content from uploaded file"""
     try:
         if file_path.lower().endswith('.pdf'):
-            # Extract text from PDF using PyMuPDF
-            doc = fitz.open(file_path)
-            text = ""
-            for page in doc:
-                text += page.get_text()
-            doc.close()
-            return text.strip()
-        else:
-            # Assume text file
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read().strip()
+            # Extract text from PDF using PyMuPDF (page ranges run in parallel for long contracts)
+            return pdf_utils.extract_pdf_text(file_path).strip()
+        # Text upload: one binary read decoded in a single pass, skipping the TextIOWrapper layer;
+        # line endings are normalized as text mode's universal newlines did
+        with open(file_path, 'rb') as f:
+            text = f.read().decode('utf-8')
+        return text.replace('\r\n', '\n').replace('\r', '\n').strip()
     except Exception as e:
-        print(f"Error extracting text from {file_path}: {e}")
+        logger.error(f"Error extracting text from {file_path}: {e}")
         return ""
 
 
@@ -160,7 +345,7 @@ def root():
         "service": "Contract-Agent vNext",
         "message": "Contract Assistant API is running with CrewAI integration",
         "version": "1.0.0",
-        "endpoints": ["/health", "/process_contract", "/job_status", "/job_result"]
+        "endpoints": ["/health", "/process_contract", "/process_contract_raw", "/job_status", "/job_result"]
     })
 
 
@@ -171,7 +356,7 @@ def health_check():
         # Check component status
         bedrock_available = bedrock_manager.test_connection() if hasattr(bedrock_manager, 'test_connection') else True
         crew_available = crew_manager is not None
-        processing_thread_alive = processing_thread.is_alive() if processing_thread else False
+        processing_thread_alive = processing_threads_alive() > 0
         
         return jsonify({
             "status": "healthy",
@@ -182,8 +367,8 @@ def health_check():
                 "processing_thread_active": processing_thread_alive,
                 "memory_storage_active": memory_storage is not None
             },
-            "queue_size": job_queue.qsize(),
-            "timestamp": datetime.now().isoformat()
+            "queue_size": len(job_queue),
+            "timestamp": datetime.now()
         }), 200
         
     except Exception as e:
@@ -200,18 +385,50 @@ def process_contract():
     Process contract document with user prompt through CrewAI workflow.
     Handles file upload + prompt from nxtApp with chunking support.
     """
+    return queue_contract_upload(stream_upload_to_disk)
+
+
+@application.route('/process_contract_raw', methods=['POST'])
+def process_contract_raw():
+    """
+    Streaming variant of /process_contract for large contracts.
+    The request body is the file itself; see stream_raw_upload_to_disk for headers.
+    """
+    return queue_contract_upload(stream_raw_upload_to_disk)
+
+
+def queue_contract_upload(read_upload):
+    """
+    Validate an upload and queue it as a contract processing job.
+    
+    Args:
+        read_upload: Callable writing the request's file to the given path and
+            returning (original filename or None, prompt text)
+    """
+    upload_path = None
     try:
+        # Reject before reading a potentially 200MB body when the backlog is full
+        if job_queue.full():
+            return queue_full_response()
+        
+        # Generate job ID up front so the upload can stream straight to disk
+        job_id = str(uuid.uuid4())
+        upload_path = os.path.join(UPLOAD_FOLDER, f"{job_id}.upload")
+        
+        try:
+            original_filename, user_prompt = read_upload(upload_path)
+        except RequestEntityTooLarge as e:
+            return request_entity_too_large(e)
+        user_prompt = user_prompt.strip()
+        
         # Validate request
-        if 'file' not in request.files:
+        if original_filename is None:
             return jsonify({
                 "error": "No file provided",
                 "success": False
             }), 400
         
-        file = request.files['file']
-        user_prompt = request.form.get('prompt', '').strip()
-        
-        if not file or file.filename == '':
+        if original_filename == '':
             return jsonify({
                 "error": "No file selected",
                 "success": False
@@ -224,56 +441,62 @@ def process_contract():
             }), 400
         
         # Validate file type
-        allowed_extensions = {'.pdf', '.txt', '.rtf'}
-        file_ext = os.path.splitext(file.filename)[1].lower()
-        if file_ext not in allowed_extensions:
+        _, dot, file_ext = original_filename.rpartition('.')
+        file_ext = file_ext.lower() if dot else ''
+        if file_ext not in ALLOWED_EXTENSIONS:
             return jsonify({
-                "error": f"Unsupported file type: {file_ext}. Supported: {', '.join(allowed_extensions)}",
+                "error": f"Unsupported file type: .{file_ext}. Supported: {SUPPORTED_EXTENSIONS_TEXT}",
                 "success": False
             }), 400
         
-        # Generate job ID and save file
-        job_id = str(uuid.uuid4())
-        filename = f"{job_id}_{file.filename}"
+        # Move the streamed upload to its job file name
+        filename = f"{job_id}_{original_filename}"
         file_path = os.path.join(UPLOAD_FOLDER, filename)
+        os.replace(upload_path, file_path)
         
-        # Save uploaded file
-        file.save(file_path)
-        
-        # Create job in memory storage
-        file_data = open(file_path, 'rb').read()
+        # Create job in memory storage - the upload stays on disk and only its path is tracked
         memory_storage.create_job(
-            file_data=file_data,
-            filename=file.filename,
+            file_data=None,
+            file_path=file_path,
+            filename=original_filename,
             user_prompt=user_prompt,
             job_id=job_id
         )
         
-        # Add job to processing queue
-        job_queue.put((job_id, user_prompt, file_path, file.filename))
+        # Add job to processing queue, dropping it again if the queue filled up meanwhile
+        try:
+            job_queue.put_nowait((job_id, user_prompt, file_path, original_filename))
+        except queue.Full:
+            memory_storage.cleanup_job(job_id)
+            return queue_full_response()
         
         # Check if processing thread is alive
-        if not processing_thread or not processing_thread.is_alive():
-            print("⚠️ Processing thread is dead, restarting...")
+        if processing_threads_alive() < CREW_WORKERS:
+            logger.warning("⚠️ Processing thread is dead, restarting...")
             start_processing_thread()
         
-        print(f"📨 Job {job_id} queued: {file.filename} with prompt: {user_prompt[:100]}...")
+        logger.info(f"📨 Job {job_id} queued: {original_filename} with prompt: {user_prompt[:100]}...")
         
         return jsonify({
             "job_id": job_id,
             "status": "queued",
             "message": "Contract processing job queued successfully",
-            "filename": file.filename,
+            "filename": original_filename,
             "prompt": user_prompt,
             "success": True
         }), 202
         
     except Exception as e:
-        print(f"Error in process_contract: {e}")
+        logger.error(f"Error in process_contract: {e}")
         return jsonify({
             "error": f"Failed to process contract: {str(e)}",
             "success": False
         }), 500
+    
+    finally:
+        # Discard the streamed upload if the request was rejected before it was moved
+        if upload_path and os.path.exists(upload_path):
+            os.remove(upload_path)
 
 
 @application.route('/job_status/<job_id>', methods=['GET'])
@@ -299,8 +522,8 @@ def get_job_status(job_id):
             "message": f"Job {job_data.status}",
             "filename": job_data.filename,
             "user_prompt": job_data.user_prompt,
-            "created_at": job_data.created_at.isoformat(),
-            "updated_at": job_data.updated_at.isoformat(),
+            "created_at": job_data.created_at,
+            "updated_at": job_data.updated_at,
             "success": True
         }
         
@@ -322,7 +545,7 @@ def get_job_status(job_id):
         return jsonify(response), 200
         
     except Exception as e:
-        print(f"Error getting job status for {job_id}: {e}")
+        logger.error(f"Error getting job status for {job_id}: {e}")
         return jsonify({
             "error": f"Failed to get job status: {str(e)}",
             "success": False
@@ -360,6 +583,8 @@ def get_job_result(job_id):
             }), 500
         
         result = job_data.result
+        original_preview = truncate_preview(result.original_rtf, 1000)
+        crew_output_preview = truncate_preview(result.crew_output, 500)
         
         response_data = {
             "job_id": job_id,
@@ -369,41 +594,112 @@ def get_job_result(job_id):
             "processing_results": {
                 "success": result.success,
                 "final_rtf": result.final_rtf,
-                "original_rtf": result.original_rtf[:1000] + "..." if len(result.original_rtf) > 1000 else result.original_rtf,
+                "original_rtf": original_preview,
                 "iterations_used": result.iterations_used,
                 "total_processing_time": result.total_processing_time,
                 "final_score": result.final_score,
-                "crew_output": result.crew_output[:500] + "..." if len(result.crew_output) > 500 else result.crew_output,
+                "crew_output": crew_output_preview,
                 "chunk_processing_stats": result.chunk_processing_stats
             },
-            "created_at": job_data.created_at.isoformat(),
-            "updated_at": job_data.updated_at.isoformat(),
+            "created_at": job_data.created_at,
+            "updated_at": job_data.updated_at,
             "success": True
         }
         
+        # The API only ever exposes these fields as previews, so drop the full
+        # text from the stored result instead of keeping it alive until cleanup
+        result.original_rtf = original_preview
+        result.crew_output = crew_output_preview
+        
         # Trigger session-based cleanup after result retrieval
         if hasattr(memory_storage, 'session_based_cleanup') and memory_storage.session_based_cleanup:
             cleanup_success = memory_storage.cleanup_completed_job_after_retrieval(job_id)
             if cleanup_success:
-                print(f"🧹 Session cleanup completed for job {job_id}")
+                logger.info(f"🧹 Session cleanup completed for job {job_id}")
         
         return jsonify(response_data), 200
         
     except Exception as e:
-        print(f"Error getting job result for {job_id}: {e}")
+        logger.error(f"Error getting job result for {job_id}: {e}")
         return jsonify({
             "error": f"Failed to get job result: {str(e)}",
             "success": False
         }), 500
 
 
+@application.route('/job_result/<job_id>/rtf', methods=['GET'])
+def get_job_result_rtf(job_id):
+    """
+    Download the final RTF of a completed job as a file.
+    Supports conditional GETs (ETag / If-None-Match) so polling clients
+    skip re-downloading unchanged results. With session-based cleanup enabled the
+    job is removed after the first full download (or JSON /job_result), so
+    revalidation only works while session cleanup is disabled.
+    """
+    try:
+        # Validate job ID format
+        if not validate_job_id(job_id):
+            return jsonify({
+                "error": "Invalid job ID format",
+                "success": False
+            }), 400
+        
+        job_data = memory_storage.get_job(job_id)
+        
+        if not job_data:
+            return jsonify({
+                "error": "Job not found",
+                "success": False
+            }), 404
+        
+        if job_data.status != "completed":
+            return jsonify({
+                "job_id": job_id,
+                "status": job_data.status,
+                "progress": job_data.progress,
+                "message": "Job not completed yet",
+                "success": False
+            }), 202
+        
+        rtf_path = rtf_output_path(job_id)
+        if not os.path.exists(rtf_path):
+            return jsonify({
+                "error": "Job completed but no RTF file found",
+                "success": False
+            }), 500
+        
+        response = send_file(
+            rtf_path,
+            mimetype='application/rtf',
+            as_attachment=True,
+            download_name=f"{os.path.splitext(job_data.filename)[0]}.rtf",
+            conditional=True,
+            etag=True
+        )
+        
+        # Trigger session-based cleanup once the file has been sent; a 304 sends nothing,
+        # so revalidation does not remove the job
+        if (response.status_code != 304 and hasattr(memory_storage, 'session_based_cleanup')
+                and memory_storage.session_based_cleanup):
+            response.call_on_close(lambda: memory_storage.cleanup_completed_job_after_retrieval(job_id))
+        
+        return response
+        
+    except Exception as e:
+        logger.error(f"Error getting job RTF for {job_id}: {e}")
+        return jsonify({
+            "error": f"Failed to get job RTF: {str(e)}",
+            "success": False
+        }), 500
+
+
 @application.route('/debug/queue', methods=['GET'])
 def debug_queue():
     """Debug endpoint to check processing queue and job status"""
     try:
         # Get queue status
-        queue_size = job_queue.qsize()
-        thread_alive = processing_thread.is_alive() if processing_thread else False
+        queue_size = len(job_queue)
+        thread_alive = processing_threads_alive() > 0
         
         # Get job statistics from memory storage
         job_stats = memory_storage.get_job_statistics() if hasattr(memory_storage, 'get_job_statistics') else {}
@@ -411,9 +707,11 @@ def debug_queue():
         return jsonify({
             "queue_size": queue_size,
             "processing_thread_alive": thread_alive,
+            "processing_threads_alive": processing_threads_alive(),
+            "crew_workers": CREW_WORKERS,
             "job_statistics": job_stats,
             "memory_storage_active": memory_storage is not None,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now()
         }), 200
         
     except Exception as e:
@@ -426,11 +724,12 @@ def debug_queue():
 def test_crewai():
     """Debug endpoint to test CrewAI workflow directly"""
     try:
-        data = request.get_json()
+        # get_json() decodes with orjson through OrjsonProvider; an empty body uses the defaults
+        data = request.get_json(silent=True) or {}
         test_rtf = data.get('test_rtf', 'This is a test contract with ABC Corporation.')
         test_prompt = data.get('test_prompt', 'Change ABC Corporation to XYZ Limited')
         
-        print(f"🧪 Testing CrewAI workflow...")
+        logger.info("🧪 Testing CrewAI workflow...")
         
         result = crew_manager.process_contract(
             original_rtf=test_rtf,
@@ -460,7 +759,7 @@ def test_crewai():
 @application.errorhandler(413)
 def request_entity_too_large(error):
     return jsonify({
-        "error": "File too large. Maximum size is 200MB.",
+        "error": FILE_TOO_LARGE_MESSAGE,
         "success": False
     }), 413
 
@@ -479,7 +778,7 @@ if __name__ == '__main__':
     
     # Start job processing thread
     start_processing_thread()
-    print(f"✅ Processing thread started: {processing_thread is not None}")
+    print(f"✅ Processing threads started: {processing_threads_alive()} (crew workers: {CREW_WORKERS})")
     
     # Start Flask server
     port = int(os.environ.get('PORT', 5002))
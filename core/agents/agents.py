@@ -7,12 +7,18 @@ Based on Agent-3.0 code style with legacy-derived system prompts.
 
 from crewai import Agent, LLM
 import os
+import threading
+from typing import Optional
 from dotenv import load_dotenv, find_dotenv
 from infrastructure.aws.bedrock_client import BedrockModelManager
 
 
 class ContractAgents:
-    def __init__(self):
+    def __init__(self, bedrock_manager: Optional[BedrockModelManager] = None):
+        """
+        Args:
+            bedrock_manager: Shared BedrockModelManager; a new one is created if omitted
+        """
         # Load environment variables from .env if present
         env_path = find_dotenv()
         if env_path:
@@ -22,28 +28,54 @@ class ContractAgents:
         self._actor_model = os.getenv("ACTOR_MODEL", "us.amazon.nova-pro-v1:0")
         self._critic_model = os.getenv("CRITIC_MODEL", "us.amazon.nova-pro-v1:0")
         
-        # Initialize Bedrock manager for custom LLM integration
-        self.bedrock_manager = BedrockModelManager()
+        # Initialize Bedrock manager for custom LLM integration (reused when the crew passes its own)
+        self.bedrock_manager = bedrock_manager or BedrockModelManager()
+        
+        # Latency-optimized Bedrock inference is only sent when enabled on the manager and
+        # supported by the model, since unsupported model/region pairs reject performanceConfig
+        actor_options = self._llm_options(self._actor_model)
+        critic_options = self._llm_options(self._critic_model)
         
         # Per-agent LLM runtime configuration following Agent-3.0 pattern
-        # Using Bedrock models through CrewAI LLM interface
+        # Using Bedrock models through CrewAI LLM interface; each call gets the same client-side
+        # read timeout as the boto3 client, so a hung request cannot hold a chunk worker thread forever
+        request_timeout = self.bedrock_manager.REQUEST_TIMEOUT_SECONDS
         self._actor_llm = LLM(
             model=self._actor_model,
             temperature=0.1,  # Low temperature for precise contract editing
             max_tokens=8000,  # Nova Pro can handle much larger outputs
+            timeout=request_timeout,
+            **actor_options,
         )
         self._critic_llm = LLM(
             model=self._critic_model,
             temperature=0.2,  # Slightly higher for evaluation flexibility
             max_tokens=8000,  # Nova Pro can handle much larger outputs
+            timeout=request_timeout,
+            **critic_options,
         )
+        
+        # Agents are cached per thread: an Agent carries per-run executor state, so it is
+        # reused across sequential kickoffs but never shared between concurrently running crews
+        self._local = threading.local()
+
+    def _llm_options(self, model_id: str) -> dict:
+        """Extra CrewAI LLM arguments for a model (performanceConfig when latency-optimized)"""
+        if self.bedrock_manager.performance_latency_for(model_id) == "optimized":
+            return {"performanceConfig": {"latency": "optimized"}}
+        return {}
 
     def contract_actor(self):
         """
         Creates the Contract Actor Agent based on legacy system prompts.
         Handles semantic contract manipulations with chunking support.
+        Built once per calling thread and reused afterwards.
         """
-        return Agent(
+        actor = getattr(self._local, "actor", None)
+        if actor is not None:
+            return actor
+        
+        actor = Agent(
             role="Contract Modification Specialist",
             goal="Apply semantic manipulations to legal contracts with precision, handling large documents through intelligent chunking",
             backstory=(
@@ -57,13 +89,20 @@ class ContractAgents:
             allow_delegation=False,
             llm=self._actor_llm,
         )
+        self._local.actor = actor
+        return actor
 
     def contract_critic(self):
         """
         Creates the Contract Critic Agent based on experiment framework evaluation logic.
         Evaluates modification quality and provides structured feedback.
+        Built once per calling thread and reused afterwards.
         """
-        return Agent(
+        critic = getattr(self._local, "critic", None)
+        if critic is not None:
+            return critic
+        
+        critic = Agent(
             role="Contract Quality Evaluator",
             goal="Evaluate contract modifications for accuracy and legal compliance with detailed scoring against acceptance criteria",
             backstory=(
@@ -78,3 +117,5 @@ class ContractAgents:
             allow_delegation=False,
             llm=self._critic_llm,
         )
+        self._local.critic = critic
+        return critic
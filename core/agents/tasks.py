@@ -9,11 +9,55 @@ from crewai import Task
 from .agents import ContractAgents
 from core.prompts.system_prompts import SystemPrompts
 import json
+from functools import lru_cache
+
+# Critic criteria used when the prompt config cannot be loaded
+DEFAULT_EVALUATION_CRITERIA = {
+    "entity_substitution": {"weight": 0.25},
+    "jurisdiction_transformation": {"weight": 0.20},
+    "liability_reallocation": {"weight": 0.20},
+    "clause_operations": {"weight": 0.20},
+    "legal_coherence": {"weight": 0.15}
+}
+DEFAULT_MINIMUM_SCORE = 0.85
+DEFAULT_CRITERIA_JSON = json.dumps(DEFAULT_EVALUATION_CRITERIA, indent=2)
+
+# Line the critic must emit right before its evaluation JSON, so the result parser
+# can locate the JSON without scanning the whole output
+EVALUATION_JSON_MARKER = "<<<EVAL_JSON>>>"
+
+
+@lru_cache(maxsize=4)
+def load_prompt_config(config_path):
+    """
+    Load and parse a prompt config file once per path.
+    
+    The critic task runs on every refinement iteration, so the parsed
+    config is cached instead of re-reading the JSON from disk each time.
+    Load failures are not cached and are retried on the next call.
+    Callers must treat the returned dict as read-only.
+    """
+    with open(config_path, 'r') as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=4)
+def load_evaluation_settings(config_path):
+    """
+    Critic evaluation settings for a prompt config.
+    
+    Returns:
+        Tuple of (evaluation criteria rendered as indented JSON, minimum score),
+        so the criteria block is not re-serialized for every critic task
+    """
+    critic_settings = load_prompt_config(config_path)['prompt_settings']['critic']
+    return json.dumps(critic_settings['evaluation_criteria'], indent=2), critic_settings['minimum_score']
 
 
 class ContractTasks:
-    def __init__(self):
-        self.agents = ContractAgents()
+    def __init__(self, agents: ContractAgents = None):
+        # Share the crew's ContractAgents so tasks and crews use the same cached agents
+        self.agents = agents or ContractAgents()
         self.system_prompts = SystemPrompts()
         # Tools will be injected from crew_manager for flexibility
         self.document_chunking = None  # Will be set by crew_manager
@@ -88,20 +132,10 @@ class ContractTasks:
         # Load evaluation criteria from config
         config_path = context.get('config_path', 'config/prompt_config.json')
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-            criteria = config['prompt_settings']['critic']['evaluation_criteria']
-            minimum_score = config['prompt_settings']['critic']['minimum_score']
+            criteria_json, minimum_score = load_evaluation_settings(config_path)
         except Exception as e:
             # Fallback criteria if config loading fails
-            criteria = {
-                "entity_substitution": {"weight": 0.25},
-                "jurisdiction_transformation": {"weight": 0.20},
-                "liability_reallocation": {"weight": 0.20},
-                "clause_operations": {"weight": 0.20},
-                "legal_coherence": {"weight": 0.15}
-            }
-            minimum_score = 0.85
+            criteria_json, minimum_score = DEFAULT_CRITERIA_JSON, DEFAULT_MINIMUM_SCORE
         
         critic_prompt = self.system_prompts.get_critic_prompt()
         
@@ -118,7 +152,7 @@ class ContractTasks:
             ATTEMPT NUMBER: {attempt_number}
             
             EVALUATION CRITERIA (with weights):
-            {json.dumps(criteria, indent=2)}
+            {criteria_json}
             
             MINIMUM ACCEPTABLE SCORE: {minimum_score}
             
@@ -132,7 +166,8 @@ class ContractTasks:
             System Prompt Context: {critic_prompt[:200]}...
             """,
             expected_output=f"""
-            Return a valid JSON object with the following structure:
+            Start your answer with the line {EVALUATION_JSON_MARKER} and follow it
+            with a valid JSON object with the following structure:
             {{
                 "overall_score": 0.XX,
                 "criteria_scores": {{
@@ -8,47 +8,144 @@ Based on Agent-3.0 crew.py pattern with contract-specific requirements.
 from crewai import Crew, Process
 from typing import Any, Dict, Optional, List, Tuple
 from dataclasses import dataclass
+import hashlib
 import json
+import orjson
+import os
+import re
+import threading
 import time
 import uuid
-from core.agents.tasks import ContractTasks
+from collections import OrderedDict
+from core.agents.tasks import ContractTasks, EVALUATION_JSON_MARKER
 from core.agents.agents import ContractAgents
 from core.document_processing.document_chunking import DocumentChunkingManager
-from infrastructure.aws.bedrock_client import BedrockModelManager
+from infrastructure.aws.bedrock_client import BedrockModelManager, RequestRateLimiter
 from core.prompts.system_prompts import SystemPrompts
 from core.types import CrewProcessingResult
 import concurrent.futures
 
 
+# Stop refining once an iteration improves the critic score by less than this
+SCORE_PLATEAU_DELTA = 0.02
+
+# Number of (document, instruction) chunk plans kept for repeated requests
+CHUNK_PLAN_CACHE_SIZE = 8
+
+# Change indicator the actor adds to each processed chunk
+CHUNK_MARKER_PATTERN = re.compile(r'CHUNK_(MODIFIED|UNCHANGED)')
+
+# Outcome of each chunk in chunked processing
+CHUNK_SKIPPED = 'skipped'          # no instruction targets, never sent to the actor
+CHUNK_MODIFIED = 'modified'        # actor reported CHUNK_MODIFIED
+CHUNK_UNCHANGED = 'unchanged'      # actor reported CHUNK_UNCHANGED
+CHUNK_UNCONFIRMED = 'unconfirmed'  # output had no marker or was too short to use
+CHUNK_FAILED = 'failed'            # crew raised or timed out; original chunk kept
+
+# Context keys holding full document text. Task descriptions already embed it, so these
+# are kept out of kickoff inputs and CrewAI does not run its placeholder pass over them
+DOCUMENT_CONTEXT_KEYS = frozenset(('original_rtf', 'current_rtf', 'modified_rtf', 'chunk_content'))
+
+
+def kickoff_inputs(context: Dict[str, Any]) -> Dict[str, Any]:
+    """Kickoff inputs for a task context, without the document text fields"""
+    return {key: value for key, value in context.items() if key not in DOCUMENT_CONTEXT_KEYS}
+
+
+JSON_DECODER = json.JSONDecoder()
+
+
+def find_json_object(text: str, start: int = 0) -> Optional[Tuple[Dict[str, Any], int, int]]:
+    """
+    Find the first JSON object in text at or after start.
+    
+    Tries raw_decode at each '{' in turn, so surrounding prose, code fences or
+    stray braces never need to be sliced out or parsed as part of the object.
+    
+    Returns:
+        (object, begin, end) with text[begin:end] the object's source, or None
+    """
+    begin = text.find('{', start)
+    while begin >= 0:
+        try:
+            obj, end = JSON_DECODER.raw_decode(text, begin)
+            if isinstance(obj, dict):
+                return obj, begin, end
+        except json.JSONDecodeError:
+            pass
+        begin = text.find('{', begin + 1)
+    return None
 
 
 class ContractProcessingCrew:
     def __init__(self, 
                  chunking_manager: Optional[DocumentChunkingManager] = None,
-                 bedrock_manager: Optional[BedrockModelManager] = None):
+                 bedrock_manager: Optional[BedrockModelManager] = None,
+                 latency_optimized: Optional[bool] = None):
         """
         Initialize Contract Processing Crew following Agent-3.0 pattern.
         
         Args:
             chunking_manager: Optional DocumentChunkingManager for large documents
             bedrock_manager: Optional BedrockModelManager for model interactions
+            latency_optimized: Request Bedrock latency-optimized inference for supported
+                models; None keeps the BEDROCK_PERFORMANCE_LATENCY setting
         """
-        # Initialize agents and tasks
-        self.tasks = ContractTasks()
-        self.agents = ContractAgents()
+        # Initialize agents and tasks; agents share the crew's Bedrock manager
+        self.bedrock_manager = bedrock_manager or BedrockModelManager()
+        if latency_optimized is not None:
+            self.bedrock_manager.set_performance_config("optimized" if latency_optimized else "standard")
+        self.agents = ContractAgents(bedrock_manager=self.bedrock_manager)
+        self.tasks = ContractTasks(agents=self.agents)
+        
+        # Load configuration
+        self.config = self._load_config()
+        actor_settings = self.config['prompt_settings']['actor']
         
         # Tools (injectable for testing/config)
-        self.chunking_manager = chunking_manager or DocumentChunkingManager()
-        self.bedrock_manager = bedrock_manager or BedrockModelManager()
+        self.chunking_manager = chunking_manager or DocumentChunkingManager(
+            chunk_size=actor_settings.get('max_chunk_size', 100000),
+            chunk_overlap=actor_settings.get('chunk_overlap', 0)
+        )
         self.system_prompts = SystemPrompts()
         
+        # Chunk concurrency follows the account's Bedrock quota rather than a fixed pool size
+        self.max_parallel_chunks = max(1, int(os.getenv('CONTRACT_CHUNK_PARALLELISM', actor_settings.get('max_parallel_chunks', 5))))
+        # The limiter lives in each crew worker process, so the per-minute budget is split
+        # evenly across the CREW_WORKERS processes to keep the total within it
+        requests_per_minute = int(os.getenv('BEDROCK_REQUESTS_PER_MINUTE', '0'))
+        if requests_per_minute > 0:
+            crew_workers = max(1, int(os.getenv('CREW_WORKERS', '4')))
+            requests_per_minute = max(1, requests_per_minute // crew_workers)
+        self.chunk_rate_limiter = RequestRateLimiter(requests_per_minute)
+        
+        # One pool for the crew's lifetime: no per-document thread start-up, and the
+        # per-thread cached actor agents survive across documents
+        self._chunk_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_parallel_chunks,
+            thread_name_prefix='crew-chunk'
+        )
+        # Timed-out chunks whose crew call was already running; their threads stay busy until
+        # the call returns, so the pool is replaced once they occupy every slot
+        self._stalled_chunk_futures: set = set()
+        
+        # Targets and chunk order (indices into the split chunks) per (document, instruction) digest pair
+        self._chunk_plan_cache: "OrderedDict[tuple, Tuple[List[str], List[int]]]" = OrderedDict()
+        self._chunk_plan_lock = threading.Lock()
+        
         # Wire tools into ContractTasks to avoid hardcoding
         setattr(self.tasks, "document_chunking", self.chunking_manager)
         setattr(self.tasks, "bedrock_manager", self.bedrock_manager)
         
-        # Load configuration
-        self.config = self._load_config()
-        
+    def close(self) -> None:
+        """Shut down the chunk worker pool without waiting for running chunks"""
+        self._chunk_executor.shutdown(wait=False, cancel_futures=True)
+
+    def __del__(self):
+        executor = getattr(self, '_chunk_executor', None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from config file"""
         try:
@@ -59,8 +156,9 @@ class ContractProcessingCrew:
             return {
                 "prompt_settings": {
                     "actor": {
-                        "max_chunk_size": 25000,
-                        "chunk_overlap": 5000,
+                        "max_chunk_size": 100000,
+                        "chunk_overlap": 0,
+                        "max_parallel_chunks": 5,
                         "max_iterations": 5,
                         "chunking_enabled": True
                     },
@@ -97,10 +195,11 @@ class ContractProcessingCrew:
         Each crew handles one chunk following the same pattern.
         """
         crews = []
+        actor = self.agents.contract_actor()
         for chunk_context in chunk_contexts:
             chunk_task = self.tasks.chunk_processing_task(chunk_context)
             crew = Crew(
-                agents=[self.agents.contract_actor()],
+                agents=[actor],
                 tasks=[chunk_task],
                 process=Process.sequential,
             )
@@ -159,11 +258,13 @@ class ContractProcessingCrew:
         
         max_iterations = min(self.config['prompt_settings']['actor']['max_iterations'], 3)  # Cap at 3 iterations for stability
         min_score = self.config['prompt_settings']['critic']['minimum_score']
+        plateau_delta = self.config['prompt_settings']['critic'].get('plateau_delta', SCORE_PLATEAU_DELTA)
         
         current_rtf = original_rtf
         iterations_used = 0
         final_score = None
         crew_outputs = []
+        debug_output = self.config['prompt_settings'].get('debug_crew_output', False)
         
         for iteration in range(1, max_iterations + 1):
             iterations_used = iteration
@@ -180,12 +281,21 @@ class ContractProcessingCrew:
             # Run actor-critic crew with proper context passing
             try:
                 crew = self.build_actor_critic_crew(context)
-                crew_result = crew.kickoff(inputs=context)
-                crew_outputs.append(f"Iteration {iteration}: {str(crew_result)}")
+                crew_result = crew.kickoff(inputs=kickoff_inputs(context))
                 
                 # Extract modified RTF and evaluation from crew result
                 modified_rtf, evaluation_result = self._extract_crew_results(crew_result, context)
                 
+                # Keep a small summary per iteration; the document itself lives in current_rtf
+                iteration_summary = {
+                    'iteration': iteration,
+                    'score': evaluation_result.get('overall_score') if evaluation_result else None,
+                    'satisfied': bool(evaluation_result and evaluation_result.get('satisfied', False))
+                }
+                if debug_output:
+                    iteration_summary['raw_output'] = str(crew_result)
+                crew_outputs.append(iteration_summary)
+                
             except Exception as e:
                 print(f"⚠️ Iteration {iteration} failed: {str(e)}")
                 if iteration == 1:
@@ -195,15 +305,33 @@ class ContractProcessingCrew:
                     # Use previous iteration result
                     break
             
+            previous_rtf = current_rtf
             if modified_rtf:
                 current_rtf = modified_rtf
                 
             # Check if evaluation meets quality threshold
-            if evaluation_result and evaluation_result.get('satisfied', False):
-                final_score = evaluation_result.get('overall_score', 0.0)
-                break
-            elif evaluation_result:
+            if evaluation_result:
+                previous_score = final_score
                 final_score = evaluation_result.get('overall_score', 0.0)
+                
+                # The numeric threshold counts even if the critic did not flag satisfied
+                if evaluation_result.get('satisfied', False) or final_score >= min_score:
+                    crew_outputs[-1]['stop_reason'] = 'threshold_met'
+                    break
+                
+                # A lower score means the actor is diverging: keep the previous, better revision
+                if previous_score is not None and final_score < previous_score:
+                    print(f"📉 Score dropped from {previous_score} to {final_score} after iteration {iteration} - keeping previous revision")
+                    current_rtf = previous_rtf
+                    final_score = previous_score
+                    crew_outputs[-1]['stop_reason'] = 'score_decreased'
+                    break
+                
+                # Another round rarely helps once the score has stopped improving
+                if previous_score is not None and final_score - previous_score < plateau_delta:
+                    print(f"📉 Score plateaued at {final_score} after iteration {iteration} - stopping refinement")
+                    crew_outputs[-1]['stop_reason'] = 'plateau'
+                    break
                 # Continue to next iteration with feedback
                 
         # Determine success - be more lenient with quality threshold
@@ -217,7 +345,7 @@ class ContractProcessingCrew:
             iterations_used=iterations_used,
             total_processing_time=time.time() - start_time,
             final_score=final_score,
-            crew_output="\n".join(crew_outputs),
+            crew_output=orjson.dumps(crew_outputs).decode(),
             error_message=None if success else f"Processing incomplete after {iterations_used} iterations (score: {final_score})"
         )
 
@@ -232,15 +360,38 @@ class ContractProcessingCrew:
             # Split document into chunks
             chunks = self.chunking_manager.split_document(original_rtf)
             
-            # Find instruction targets and prioritize chunks
-            targets = self.chunking_manager.find_instruction_targets(user_prompt, original_rtf)
-            prioritized_chunks = self.chunking_manager.prioritize_chunks(chunks, targets)
+            # Find instruction targets and the order in which to process the chunks
+            targets, priority_order = self._plan_chunks(original_rtf, user_prompt, chunks)
             
-            # Process chunks in parallel with rate limiting
-            processed_chunks = self._process_chunks_parallel(
-                prioritized_chunks, user_prompt, job_id
+            # Process chunks in parallel with rate limiting; results come back in document order
+            processed_chunks, chunk_statuses = self._process_chunks_parallel(
+                chunks, user_prompt, job_id, targets, priority_order
             )
             
+            chunk_stats = {
+                'total_chunks': len(chunks),
+                'processed_chunks': len(processed_chunks),
+                'targets_found': len(targets),
+                'failed_chunks': chunk_statuses.count(CHUNK_FAILED)
+            }
+            
+            # Only skip reassembly and the final evaluation when every chunk sent to the actor
+            # explicitly reported CHUNK_UNCHANGED; failed, timed-out or unmarked chunks are evaluated
+            if all(status in (CHUNK_SKIPPED, CHUNK_UNCHANGED) for status in chunk_statuses):
+                print("✅ No chunk was modified - skipping final evaluation")
+                return CrewProcessingResult(
+                    success=True,
+                    job_id=job_id,
+                    final_rtf=original_rtf,
+                    original_rtf=original_rtf,
+                    iterations_used=1,
+                    total_processing_time=time.time() - start_time,
+                    final_score=1.0,
+                    crew_output=f"Chunked processing: {len(chunks)} chunks processed, no changes required",
+                    error_message=None,
+                    chunk_processing_stats=chunk_stats
+                )
+            
             # Reassemble document
             final_rtf = self.chunking_manager.reassemble_chunks(processed_chunks)
             
@@ -260,18 +411,12 @@ class ContractProcessingCrew:
                 process=Process.sequential,
             )
             
-            evaluation_result = evaluation_crew.kickoff(inputs=context)
+            evaluation_result = evaluation_crew.kickoff(inputs=kickoff_inputs(context))
             _, evaluation_data = self._extract_crew_results(evaluation_result)
             
             final_score = evaluation_data.get('overall_score', 0.0) if evaluation_data else 0.0
             success = final_score >= self.config['prompt_settings']['critic']['minimum_score']
             
-            chunk_stats = {
-                'total_chunks': len(chunks),
-                'processed_chunks': len(processed_chunks),
-                'targets_found': len(targets)
-            }
-            
             return CrewProcessingResult(
                 success=success,
                 job_id=job_id,
@@ -298,15 +443,62 @@ class ContractProcessingCrew:
                 error_message=f"Chunked processing failed: {str(e)}"
             )
 
+    def _plan_chunks(self, original_rtf: str, user_prompt: str, chunks: List[str]) -> Tuple[List[str], List[int]]:
+        """
+        Find instruction targets and chunk priority order, memoized per document and instruction.
+        
+        Args:
+            original_rtf: Full document the chunks were split from
+            user_prompt: User instruction used to mine targets
+            chunks: Chunks of original_rtf from split_document
+            
+        Returns:
+            Tuple of (targets, indices into chunks with the most relevant first)
+        """
+        # Same digest as the split_document cache; only targets and chunk indices are
+        # kept, so cached entries never hold document text
+        cache_key = (
+            hashlib.blake2b(original_rtf.encode('utf-8', 'surrogatepass'), digest_size=16).digest(),
+            hashlib.blake2b(user_prompt.encode('utf-8', 'surrogatepass'), digest_size=16).digest(),
+            len(chunks),
+        )
+        with self._chunk_plan_lock:
+            cached = self._chunk_plan_cache.get(cache_key)
+            if cached is not None:
+                self._chunk_plan_cache.move_to_end(cache_key)
+        
+        if cached is not None:
+            targets, order = cached
+        else:
+            targets = self.chunking_manager.find_instruction_targets(user_prompt, original_rtf)
+            order = self.chunking_manager.prioritize_chunk_indices(chunks, targets)
+            with self._chunk_plan_lock:
+                self._chunk_plan_cache[cache_key] = (targets, order)
+                if len(self._chunk_plan_cache) > CHUNK_PLAN_CACHE_SIZE:
+                    self._chunk_plan_cache.popitem(last=False)
+        
+        return list(targets), list(order)
+
     def _process_chunks_parallel(self, 
                                 chunks: List[str], 
                                 user_prompt: str, 
-                                job_id: str) -> List[Tuple[str, bool]]:
+                                job_id: str,
+                                targets: Optional[List[str]] = None,
+                                order: Optional[List[int]] = None) -> Tuple[List[Tuple[str, bool]], List[str]]:
         """
-        Process chunks in parallel with rate limiting (max 5 concurrent as per requirements).
+        Process chunks in parallel with rate limiting (max_parallel_chunks concurrent, 5 by default).
+        Chunks that contain none of the instruction targets pass through unchanged
+        without an LLM call; with no targets every chunk is processed.
+        
+        Args:
+            chunks: Chunks in document order
+            order: Indices into chunks in the order they are submitted (most relevant
+                first); defaults to document order
+        
+        Returns:
+            Tuple of ((content, was_modified) per chunk, CHUNK_* status per chunk), both in
+            document order so the results can be reassembled directly
         """
-        processed_chunks = []
-        max_workers = 5  # Rate limiting for Bedrock API
         chunk_timeout = 600  # 10 minutes timeout per chunk - increased for large contracts
         
         # Prepare chunk contexts
@@ -321,41 +513,83 @@ class ContractProcessingCrew:
             }
             chunk_contexts.append(context)
         
-        # Process chunks in parallel batches
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all chunk processing tasks
-            future_to_chunk = {}
-            for i, context in enumerate(chunk_contexts):
-                chunk_task = self.tasks.chunk_processing_task(context)
-                crew = Crew(
-                    agents=[self.agents.contract_actor()],
-                    tasks=[chunk_task],
-                    process=Process.sequential,
-                )
-                future = executor.submit(crew.kickoff, inputs=context)
-                future_to_chunk[future] = (i, context['chunk_content'])
-            
-            # Collect results maintaining order
-            results = {}
-            for future in concurrent.futures.as_completed(future_to_chunk, timeout=chunk_timeout):
-                chunk_index, original_chunk = future_to_chunk[future]
-                try:
-                    crew_result = future.result(timeout=chunk_timeout)
-                    processed_content = self._extract_chunk_result(crew_result, original_chunk)
-                    results[chunk_index] = processed_content
-                except concurrent.futures.TimeoutError:
-                    print(f"⚠️ Chunk {chunk_index} processing timed out after {chunk_timeout}s - using original")
-                    results[chunk_index] = (original_chunk, False)
-                except Exception as e:
-                    print(f"⚠️ Chunk {chunk_index} processing failed: {e} - using original")
-                    # If chunk processing fails, use original chunk
-                    results[chunk_index] = (original_chunk, False)
-            
-            # Reconstruct ordered list
-            for i in range(len(chunks)):
-                processed_chunks.append(results.get(i, (chunks[i], False)))
+        # Submit targeted chunk processing tasks to the crew's long-lived pool, most relevant
+        # first; crews are built on the executor threads
+        future_to_chunk = {}
+        results: List[Optional[Tuple[str, bool]]] = [None] * len(chunks)
+        statuses: List[Optional[str]] = [None] * len(chunks)
+        skipped = 0
+        for i in (order if order is not None else range(len(chunks))):
+            context = chunk_contexts[i]
+            if not self.chunking_manager.chunk_overlaps_targets(context['chunk_content'], targets):
+                results[i] = (context['chunk_content'], False)
+                statuses[i] = CHUNK_SKIPPED
+                skipped += 1
+                continue
+            future = self._chunk_executor.submit(self._run_chunk_crew, context)
+            future_to_chunk[future] = (i, context['chunk_content'])
+        
+        print(f"📑 Processing {len(future_to_chunk)} of {len(chunks)} chunks; {skipped} contain no instruction targets")
+        
+        # Collect results into each chunk's document position; each chunk gets its own
+        # timeout window, so one slow chunk cannot discard the results of the others
+        for future, (chunk_index, original_chunk) in future_to_chunk.items():
+            try:
+                crew_result = future.result(timeout=chunk_timeout)
+                processed_content, status = self._extract_chunk_result(crew_result, original_chunk)
+                results[chunk_index] = (processed_content, status == CHUNK_MODIFIED)
+                statuses[chunk_index] = status
+            except concurrent.futures.TimeoutError:
+                print(f"⚠️ Chunk {chunk_index} processing timed out after {chunk_timeout}s - using original")
+                # Frees the worker slot if the chunk has not started yet; a running call keeps its thread
+                if not future.cancel():
+                    self._stalled_chunk_futures.add(future)
+                    print(f"⚠️ Chunk {chunk_index} is still running - its worker thread stays busy until the call returns")
+                    self._recycle_stalled_chunk_executor()
+                results[chunk_index] = (original_chunk, False)
+                statuses[chunk_index] = CHUNK_FAILED
+            except Exception as e:
+                print(f"⚠️ Chunk {chunk_index} processing failed: {e} - using original")
+                # If chunk processing fails, use original chunk
+                results[chunk_index] = (original_chunk, False)
+                statuses[chunk_index] = CHUNK_FAILED
+        
+        # Every slot is filled: skipped chunks above, submitted chunks by the collection loop
+        return results, statuses
+
+    def _recycle_stalled_chunk_executor(self) -> None:
+        """
+        Replace the chunk pool once timed-out chunks that are still running hold all of
+        its threads; the old pool is shut down without waiting, so its threads exit as
+        their calls return.
+        """
+        self._stalled_chunk_futures = {future for future in self._stalled_chunk_futures if not future.done()}
+        if len(self._stalled_chunk_futures) < self.max_parallel_chunks:
+            return
         
-        return processed_chunks
+        print(f"⚠️ {len(self._stalled_chunk_futures)} timed-out chunks hold every chunk worker thread - replacing the chunk pool")
+        stalled_executor = self._chunk_executor
+        self._chunk_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_parallel_chunks,
+            thread_name_prefix='crew-chunk'
+        )
+        stalled_executor.shutdown(wait=False)
+        self._stalled_chunk_futures.clear()
+
+    def _run_chunk_crew(self, context: Dict[str, Any]):
+        """
+        Build and run the crew for one chunk on the calling executor thread.
+        Building it here lets each thread reuse its own cached actor agent.
+        """
+        # Hold the chunk until the per-minute Bedrock budget allows another request
+        self.chunk_rate_limiter.acquire()
+        chunk_task = self.tasks.chunk_processing_task(context)
+        crew = Crew(
+            agents=[self.agents.contract_actor()],
+            tasks=[chunk_task],
+            process=Process.sequential,
+        )
+        return crew.kickoff(inputs=kickoff_inputs(context))
 
     def _extract_crew_results(self, crew_result, context=None) -> Tuple[Optional[str], Optional[Dict]]:
         """
@@ -378,27 +612,19 @@ class ContractProcessingCrew:
                     output_str = str(task_output)
                     
                     if i == 0:  # First task is actor (modification)
-                        # Remove JSON if accidentally included
-                        if '{' in output_str and '}' in output_str:
-                            json_start = output_str.find('{')
-                            if json_start > 100:  # Only remove if JSON is not at the beginning
+                        # Remove a JSON object accidentally appended after the document; only a
+                        # non-empty object that ends the output counts, so RTF groups are kept
+                        modified_rtf = output_str
+                        appended = find_json_object(output_str, 101)  # Only remove if JSON is not at the beginning
+                        while appended is not None:
+                            obj, json_start, json_end = appended
+                            if obj and not output_str[json_end:].strip():
                                 modified_rtf = output_str[:json_start].strip()
-                            else:
-                                modified_rtf = output_str
-                        else:
-                            modified_rtf = output_str
+                                break
+                            appended = find_json_object(output_str, json_start + 1)
                     
                     elif i == 1:  # Second task is critic (evaluation)
-                        # Extract JSON evaluation
-                        if '{' in output_str and '}' in output_str:
-                            try:
-                                json_start = output_str.find('{')
-                                json_end = output_str.rfind('}') + 1
-                                json_str = output_str[json_start:json_end]
-                                evaluation_data = json.loads(json_str)
-                            except json.JSONDecodeError:
-                                # If JSON parsing fails, use defaults
-                                evaluation_data = default_evaluation
+                        evaluation_data = self._parse_evaluation_json(output_str)
                 
                 return modified_rtf or result_str, evaluation_data or default_evaluation
             
@@ -418,37 +644,90 @@ class ContractProcessingCrew:
             original_rtf = context.get('original_rtf', '') if context else str(crew_result)
             return original_rtf, default_evaluation
 
-    def _extract_chunk_result(self, crew_result, original_chunk: str) -> Tuple[str, bool]:
+    def _parse_evaluation_json(self, output_str: str) -> Optional[Dict]:
+        """
+        Parse the critic's evaluation JSON.
+        
+        Decodes the first JSON object after EVALUATION_JSON_MARKER with raw_decode,
+        so trailing text is never scanned. Falls back to the first decodable
+        JSON object anywhere in the output when the critic omitted the marker.
+        
+        Returns:
+            Evaluation dict, or None if no JSON object could be parsed
+        """
+        marker_pos = output_str.find(EVALUATION_JSON_MARKER)
+        if marker_pos >= 0:
+            json_start = output_str.find('{', marker_pos + len(EVALUATION_JSON_MARKER))
+            if json_start >= 0:
+                try:
+                    evaluation_data, _ = JSON_DECODER.raw_decode(output_str, json_start)
+                    return evaluation_data
+                except json.JSONDecodeError:
+                    pass
+        
+        found = find_json_object(output_str)
+        # If JSON parsing fails, use defaults
+        return found[0] if found else None
+
+    def _extract_chunk_result(self, crew_result, original_chunk: str) -> Tuple[str, str]:
         """
         Extract processed chunk content from crew result.
-        Returns: (processed_content, was_modified)
+        Returns: (processed_content, status) with status one of CHUNK_MODIFIED,
+        CHUNK_UNCHANGED or CHUNK_UNCONFIRMED
         """
         try:
             result_str = str(crew_result)
             
             # Check for change indicator
-            was_modified = 'CHUNK_MODIFIED' in result_str
+            marker = CHUNK_MARKER_PATTERN.search(result_str)
+            if marker is None:
+                status = CHUNK_UNCONFIRMED
+            elif marker.group(1) == 'MODIFIED':
+                status = CHUNK_MODIFIED
+            else:
+                status = CHUNK_UNCHANGED
             
             # Extract content (remove change indicators)
-            content = result_str.replace('CHUNK_MODIFIED', '').replace('CHUNK_UNCHANGED', '').strip()
+            content = CHUNK_MARKER_PATTERN.sub('', result_str).strip()
             
             # If content is empty or too short, use original
             if not content or len(content) < len(original_chunk) * 0.5:
-                content = original_chunk
-                was_modified = False
+                return original_chunk, CHUNK_UNCONFIRMED
                 
-            return content, was_modified
+            return content, status
             
         except Exception as e:
-            return original_chunk, False
+            return original_chunk, CHUNK_UNCONFIRMED
 
 
 # Convenience functions following Agent-3.0 pattern
-_default_crew = ContractProcessingCrew()
+# Built on first use so importing this module does not construct Bedrock clients
+_default_crew: Optional[ContractProcessingCrew] = None
+_default_crew_lock = threading.Lock()
+
+def _get_default_crew() -> ContractProcessingCrew:
+    """Return the shared crew, creating it on first call"""
+    global _default_crew
+    if _default_crew is None:
+        with _default_crew_lock:
+            if _default_crew is None:
+                _default_crew = ContractProcessingCrew()
+    return _default_crew
+
+def init_crew_worker() -> None:
+    """
+    Process pool initializer for crew workers.
+    Builds the shared crew up front so the worker's first job does not pay for it;
+    a failure is left to surface on that job instead of breaking the pool.
+    """
+    try:
+        _get_default_crew()
+    except Exception as e:
+        print(f"⚠️ Crew worker could not pre-build the crew: {e}")
 
 def process_contract(original_rtf: str, user_prompt: str, job_id: str = None) -> CrewProcessingResult:
     """Convenience function for contract processing"""
-    return _default_crew.process_contract(original_rtf, user_prompt, job_id)
+    return _get_default_crew().process_contract(original_rtf, user_prompt, job_id)
 
 def process_contract_chunked(original_rtf: str, user_prompt: str, job_id: str = None) -> CrewProcessingResult:
     """Force chunked processing for testing"""
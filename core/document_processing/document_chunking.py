@@ -7,11 +7,47 @@ for context preservation.
 """
 
 import re
+import hashlib
+import logging
+import threading
 import concurrent.futures
-from typing import List, Tuple, Optional
+from collections import OrderedDict
+from typing import Dict, List, Tuple, Optional
+import ahocorasick
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 
 
+# Instruction parsing patterns for find_instruction_targets
+QUOTED_DOUBLE_PATTERN = re.compile(r'"([^"]*)"')
+QUOTED_SINGLE_PATTERN = re.compile(r"'([^']*)'")
+INSTRUCTION_SPLIT_PATTERN = re.compile(r'\n|\d+\.|\s*-\s*')
+
+# Key verbs that indicate actions in an instruction
+ACTION_VERBS = ("change", "modify", "replace", "update", "set", "remove", "delete", "add", "insert")
+
+# Common fields in contracts
+COMMON_FIELDS = (
+    "effective date", "term", "termination", "governing law", "state", 
+    "jurisdiction", "payment terms", "client", "provider", "customer",
+    "representative", "fee", "price", "pricing", "deliverable", "party", "parties",
+    "section", "article", "clause", "paragraph", "agreement", "contract"
+)
+
+# Section headings/contract structure markers that might indicate important parts
+STRUCTURE_MARKERS = (
+    "section", "article", "clause", "paragraph", 
+    "parties", "agreement", "witnesseth", "whereas",
+    "term", "termination", "payment", "services", "obligations",
+    "governing law", "liability", "indemnification"
+)
+
+# Split results remembered per manager, so retries of the same document skip the splitter
+SPLIT_CACHE_SIZE = 8
+
+# Shortest boundary overlap removed on reassembly; shorter suffix/prefix matches are coincidental
+MIN_STITCH_OVERLAP = 32
+
+
 class DocumentChunkingManager:
     """
     Manages document chunking for large contract processing.
@@ -24,21 +60,29 @@ class DocumentChunkingManager:
     - Document reassembly with integrity validation
     """
     
-    def __init__(self, chunk_size: int = 100000, chunk_overlap: int = 10000):
+    def __init__(self, chunk_size: int = 100000, chunk_overlap: int = 0):
         """
         Initialize the DocumentChunkingManager.
         
         Args:
             chunk_size: Maximum size of each chunk in characters (default: 100,000)
-            chunk_overlap: Overlap between chunks in characters (default: 10,000)
+            chunk_overlap: Overlap between chunks in characters (default: 0). Chunks are
+                rewritten by the actor and concatenated back, so any overlap is both an
+                extra LLM cost and duplicated text in the reassembled document.
         """
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self.logger = logging.getLogger(__name__)
+        self._split_cache: "OrderedDict[tuple, List[str]]" = OrderedDict()
+        self._split_cache_lock = threading.Lock()
+        # Split on paragraph, line, then sentence boundaries; whitespace is kept so
+        # concatenating the chunks reproduces the original document exactly
         self.text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
             length_function=len,
-            separators=["\n\n", "\n", " ", ""]
+            separators=["\n\n", "\n", ". ", " ", ""],
+            strip_whitespace=False
         )
     
     def should_chunk_document(self, document_content: str) -> bool:
@@ -63,12 +107,27 @@ class DocumentChunkingManager:
         Returns:
             List of document chunks
         """
-        if not self.should_chunk_document(document_content):
+        # Same threshold as should_chunk_document, inlined on this per-request path
+        if len(document_content) < self.chunk_size:
             return [document_content]
         
+        # Keyed by content digest so multi-MB documents are not held as dict keys
+        digest = hashlib.blake2b(document_content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        cache_key = (digest, self.chunk_size, self.chunk_overlap)
+        with self._split_cache_lock:
+            cached = self._split_cache.get(cache_key)
+            if cached is not None:
+                self._split_cache.move_to_end(cache_key)
+                return list(cached)
+        
         chunks = self.text_splitter.split_text(document_content)
-        print(f"Document split into {len(chunks)} chunks")
-        return chunks
+        self.logger.info("Document split into %d chunks", len(chunks))
+        
+        with self._split_cache_lock:
+            self._split_cache[cache_key] = chunks
+            if len(self._split_cache) > SPLIT_CACHE_SIZE:
+                self._split_cache.popitem(last=False)
+        return list(chunks)
     
     def find_instruction_targets(self, instruction: str, document: str) -> List[str]:
         """
@@ -86,116 +145,159 @@ class DocumentChunkingManager:
         """
         targets = []
         
+        # Lowercase once; every search below runs against these buffers
+        doc_lower = document.lower()
+        instr_lower = instruction.lower()
+        
         # Extract quoted text (likely direct references)
-        quoted_text = re.findall(r'"([^"]*)"', instruction)
-        quoted_text.extend(re.findall(r"'([^']*)'", instruction))
-        
-        # Process each quoted text segment
-        for text in quoted_text:
-            if len(text) > 3:
-                # Look for case-insensitive matches
-                text_lower = text.lower()
-                doc_lower = document.lower()
-                
-                # Try to find all occurrences 
-                start_pos = 0
-                while start_pos < len(doc_lower):
-                    found_pos = doc_lower.find(text_lower, start_pos)
-                    if found_pos == -1:
-                        break
-                    
-                    # Extract a context window around the match
-                    context_start = max(0, found_pos - 100)
-                    context_end = min(len(document), found_pos + len(text) + 200)
-                    context = document[context_start:context_end]
-                    targets.append(context)
-                    
-                    # Move to next position
-                    start_pos = found_pos + len(text)
+        quoted_text = QUOTED_DOUBLE_PATTERN.findall(instruction)
+        quoted_text.extend(QUOTED_SINGLE_PATTERN.findall(instruction))
+        quoted_needles = [text.lower() for text in quoted_text if len(text) > 3]
         
         # Split instruction into individual requests (common for multi-part instructions)
-        instruction_parts = re.split(r'\n|\d+\.|\s*-\s*', instruction)
+        instruction_parts = INSTRUCTION_SPLIT_PATTERN.split(instruction)
         
-        # Process each instruction part
+        # Look for action verbs followed by potential targets
+        verb_needles = []
         for part in instruction_parts:
             part = part.strip()
             if len(part) < 5:  # Skip very short parts
                 continue
-                
-            # Extract key verbs and subjects that indicate actions
-            action_verbs = ["change", "modify", "replace", "update", "set", "remove", "delete", "add", "insert"]
             
-            # Look for action verbs followed by potential targets
-            for verb in action_verbs:
-                if verb in part.lower():
-                    verb_pos = part.lower().find(verb)
-                    # Extract the target phrase (text after the verb)
-                    if verb_pos >= 0 and verb_pos + len(verb) + 1 < len(part):
-                        target_phrase = part[verb_pos + len(verb):].strip()
-                        if len(target_phrase) > 3:
-                            # Find this phrase in the document
-                            # Use first few words for searching
-                            search_terms = " ".join(target_phrase.split()[:3])
-                            if len(search_terms) > 3:
-                                # Look for the search terms in document
-                                doc_lower = document.lower()
-                                search_lower = search_terms.lower()
-                                found_pos = doc_lower.find(search_lower)
-                                if found_pos >= 0:
-                                    # Extract context around match
-                                    context_start = max(0, found_pos - 100)
-                                    context_end = min(len(document), found_pos + len(search_terms) + 200)
-                                    context = document[context_start:context_end]
-                                    targets.append(context)
-        
-        # Look for common fields in contracts
-        common_fields = [
-            "effective date", "term", "termination", "governing law", "state", 
-            "jurisdiction", "payment terms", "client", "provider", "customer",
-            "representative", "fee", "price", "pricing", "deliverable", "party", "parties",
-            "section", "article", "clause", "paragraph", "agreement", "contract"
-        ]
-        
-        # Add any common fields mentioned in the instruction
-        for field in common_fields:
-            if field in instruction.lower():
-                # Find this field in the document (could be multiple occurrences)
-                field_lower = field.lower()
-                doc_lower = document.lower()
-                
-                # Find all occurrences
-                start_pos = 0
-                while start_pos < len(doc_lower):
-                    found_pos = doc_lower.find(field_lower, start_pos)
-                    if found_pos == -1:
-                        break
-                    
-                    # Extract a context window around the match
-                    context_start = max(0, found_pos - 50)
-                    context_end = min(len(document), found_pos + len(field) + 200)
-                    context = document[context_start:context_end]
-                    targets.append(context)
-                    
-                    # Move to next position
-                    start_pos = found_pos + len(field)
+            part_lower = part.lower()
+            for verb in ACTION_VERBS:
+                verb_pos = part_lower.find(verb)
+                # Extract the target phrase (text after the verb)
+                if verb_pos >= 0 and verb_pos + len(verb) + 1 < len(part):
+                    target_phrase = part[verb_pos + len(verb):].strip()
+                    if len(target_phrase) > 3:
+                        # Use first few words for searching
+                        search_terms = " ".join(target_phrase.split()[:3])
+                        if len(search_terms) > 3:
+                            verb_needles.append(search_terms.lower())
+        
+        # Add any common contract fields mentioned in the instruction
+        field_needles = [field for field in COMMON_FIELDS if field in instr_lower]
+        
+        # Find every needle in a single pass over the document
+        occurrences = self._find_all_occurrences(doc_lower, quoted_needles + verb_needles + field_needles)
+        
+        # Quoted text: context window around every occurrence
+        for needle in quoted_needles:
+            for found_pos in occurrences[needle]:
+                context_start = max(0, found_pos - 100)
+                context_end = min(len(document), found_pos + len(needle) + 200)
+                targets.append(document[context_start:context_end])
+        
+        # Verb phrases: context around the first occurrence only
+        for needle in verb_needles:
+            if occurrences[needle]:
+                found_pos = occurrences[needle][0]
+                context_start = max(0, found_pos - 100)
+                context_end = min(len(document), found_pos + len(needle) + 200)
+                targets.append(document[context_start:context_end])
+        
+        # Common fields: context window around every occurrence
+        for needle in field_needles:
+            for found_pos in occurrences[needle]:
+                context_start = max(0, found_pos - 50)
+                context_end = min(len(document), found_pos + len(needle) + 200)
+                targets.append(document[context_start:context_end])
         
         # Remove duplicates and near-duplicates
         unique_targets = []
+        seen = set()
         for target in targets:
-            # Check if this target is too similar to existing ones
-            is_duplicate = False
-            for existing in unique_targets:
-                # Simple overlap check
-                if target in existing or existing in target:
-                    is_duplicate = True
-                    break
+            # Repeated contexts are common (overlapping needles); a set lookup settles them
+            if target in seen:
+                continue
+            seen.add(target)
+            
+            # Containment check; only the shorter string can be inside the longer one
+            is_duplicate = any(
+                target in existing if len(target) <= len(existing) else existing in target
+                for existing in unique_targets
+            )
             
             if not is_duplicate:
                 unique_targets.append(target)
         
-        print(f"Found {len(unique_targets)} unique target sections in document")
+        self.logger.info("Found %d unique target sections in document", len(unique_targets))
         return unique_targets
     
+    @staticmethod
+    def _build_automaton(needles) -> "ahocorasick.Automaton":
+        """
+        Build an Aho-Corasick automaton whose matches report the needle itself.
+        
+        Args:
+            needles: Non-empty lowercased search strings
+            
+        Returns:
+            Automaton ready for iter()
+        """
+        automaton = ahocorasick.Automaton()
+        for needle in needles:
+            automaton.add_word(needle, needle)
+        automaton.make_automaton()
+        return automaton
+    
+    @staticmethod
+    def _find_all_occurrences(doc_lower: str, needles: List[str]) -> Dict[str, List[int]]:
+        """
+        Locate all needles with one Aho-Corasick scan of the document.
+        
+        Matches of the same needle do not overlap, as with repeated str.find calls
+        that resume after the previous match.
+        
+        Args:
+            doc_lower: Lowercased document content
+            needles: Lowercased search strings
+            
+        Returns:
+            Start positions of each needle, in document order
+        """
+        occurrences = {needle: [] for needle in needles}
+        if not occurrences:
+            return occurrences
+        
+        automaton = DocumentChunkingManager._build_automaton(occurrences)
+        next_start = dict.fromkeys(occurrences, 0)
+        for end_pos, needle in automaton.iter(doc_lower):
+            found_pos = end_pos - len(needle) + 1
+            if found_pos >= next_start[needle]:
+                occurrences[needle].append(found_pos)
+                next_start[needle] = found_pos + len(needle)
+        return occurrences
+    
+    def chunk_overlaps_targets(self, chunk: str, targets: List[str]) -> bool:
+        """
+        Check whether a chunk contains any instruction target.
+        
+        Uses the same matching as prioritize_chunks: a full target match, or either
+        half of a longer target (for targets split across a chunk boundary).
+        
+        Args:
+            chunk: Document chunk to check
+            targets: Target sections from find_instruction_targets
+            
+        Returns:
+            True if the chunk may be affected by the instruction (always True without targets)
+        """
+        if not targets:
+            return True
+        
+        chunk_lower = chunk.lower()
+        for target in targets:
+            target_lower = target.lower()
+            if target_lower in chunk_lower:
+                return True
+            if len(target_lower) > 10:
+                half = len(target_lower) // 2
+                if target_lower[:half] in chunk_lower or target_lower[half:] in chunk_lower:
+                    return True
+        return False
+    
     def prioritize_chunks(self, chunks: List[str], targets: List[str]) -> List[str]:
         """
         Reorder chunks based on target relevance and importance.
@@ -213,50 +315,69 @@ class DocumentChunkingManager:
         if not targets:
             return chunks
         
+        return [chunks[i] for i in self.prioritize_chunk_indices(chunks, targets)]
+    
+    def prioritize_chunk_indices(self, chunks: List[str], targets: List[str]) -> List[int]:
+        """
+        Order chunk indices by target relevance, as used by prioritize_chunks.
+        
+        Args:
+            chunks: List of document chunks
+            targets: List of target sections to prioritize
+            
+        Returns:
+            Indices into chunks with the most relevant first
+        """
+        if not targets:
+            return list(range(len(chunks)))
+        
+        # One automaton over targets, target halves and markers; each chunk is then scanned once
+        target_needles = []
+        for target in targets:
+            target_lower = target.lower()
+            if len(target_lower) > 10:
+                half = len(target_lower) // 2
+                target_needles.append((target_lower, target_lower[:half], target_lower[half:]))
+            else:
+                target_needles.append((target_lower, None, None))
+        needles = list(STRUCTURE_MARKERS) + [needle for group in target_needles for needle in group if needle]
+        automaton = self._build_automaton(needles)
+        
         # Score each chunk based on target presence and relevance
         chunk_scores = []
         for i, chunk in enumerate(chunks):
             # Initialize score for this chunk
             score = 0
-            chunk_lower = chunk.lower()
+            
+            # First position of every needle present in the chunk
+            first_pos = {}
+            for end_pos, needle in automaton.iter(chunk.lower()):
+                if needle not in first_pos:
+                    first_pos[needle] = end_pos - len(needle) + 1
             
             # Score based on target presence
-            for target in targets:
-                target_lower = target.lower()
-                
+            for target_lower, first_half, second_half in target_needles:
                 # If target is fully contained in chunk, add higher score
-                if target_lower in chunk_lower:
+                if target_lower in first_pos:
                     score += 5
                     
                     # Extra points if it's at the beginning or middle of the chunk (more likely to be complete)
-                    target_pos = chunk_lower.find(target_lower)
+                    target_pos = first_pos[target_lower]
                     if target_pos < len(chunk) // 3:  # In the first third
                         score += 2
                     elif target_pos < len(chunk) * 2 // 3:  # In the middle third
                         score += 1
                 
-                # If at least half of the target is in the chunk
-                elif len(target_lower) > 10:
-                    # Check for partial matches (first half or second half)
-                    first_half = target_lower[:len(target_lower)//2]
-                    second_half = target_lower[len(target_lower)//2:]
-                    
-                    if first_half in chunk_lower:
+                # If at least half of the target is in the chunk (first half or second half)
+                elif first_half is not None:
+                    if first_half in first_pos:
                         score += 2
-                    if second_half in chunk_lower:
+                    if second_half in first_pos:
                         score += 2
             
-            # Look for section headings/contract structure markers that might indicate important parts
-            structure_markers = [
-                "section", "article", "clause", "paragraph", 
-                "parties", "agreement", "witnesseth", "whereas",
-                "term", "termination", "payment", "services", "obligations",
-                "governing law", "liability", "indemnification"
-            ]
-            
             # Add points for structure markers
-            for marker in structure_markers:
-                if marker in chunk_lower:
+            for marker in STRUCTURE_MARKERS:
+                if marker in first_pos:
                     score += 1
             
             # Store score with chunk index
@@ -265,18 +386,14 @@ class DocumentChunkingManager:
         # Sort chunks by score (descending) and original order for equally scored chunks
         chunk_scores.sort(key=lambda x: (-x[1], x[0]))
         
-        # Extract the reordering
-        prioritized_indices = [i for i, _ in chunk_scores]
-        
         # Create debug output to show the prioritization
-        print("Chunk prioritization:")
-        for idx, (orig_idx, score) in enumerate(chunk_scores):
-            print(f"  Position {idx}: Chunk {orig_idx} (score: {score})")
-        
-        # Reorder chunks based on scores
-        prioritized_chunks = [chunks[i] for i in prioritized_indices]
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Chunk prioritization:")
+            for idx, (orig_idx, score) in enumerate(chunk_scores):
+                self.logger.debug("  Position %d: Chunk %d (score: %d)", idx, orig_idx, score)
         
-        return prioritized_chunks
+        # Extract the reordering
+        return [i for i, _ in chunk_scores]
     
     def process_chunks_parallel(
         self, 
@@ -309,7 +426,7 @@ class DocumentChunkingManager:
                 return idx, result, changed
             except Exception as e:
                 error_msg = str(e)
-                print(f"Error processing chunk {chunk_id}: {error_msg}")
+                self.logger.error("Error processing chunk %s: %s", chunk_id, error_msg)
                 
                 # Check for credential errors
                 if "AWS Credentials Error" in error_msg or "security token" in error_msg.lower():
@@ -322,12 +439,14 @@ class DocumentChunkingManager:
         # Use parallel processing for chunks with ThreadPoolExecutor
         # Add rate limiting for Bedrock API
         max_workers = min(total_chunks, max_workers)
-        print(f"Processing {total_chunks} chunks with {max_workers} workers")
+        self.logger.info("Processing %d chunks with %d workers", total_chunks, max_workers)
         
         chunk_args = [(chunk, i) for i, chunk in enumerate(chunks)]
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(process_chunk_worker, arg): arg for arg in chunk_args}
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        aborted = False
+        try:
+            futures = [executor.submit(process_chunk_worker, arg) for arg in chunk_args]
             completed = 0
             
             for future in concurrent.futures.as_completed(futures):
@@ -335,17 +454,19 @@ class DocumentChunkingManager:
                     idx, result, changed = future.result()
                     processed_chunks[idx] = (result, changed)
                     completed += 1
-                    print(f"Completed chunk {completed}/{total_chunks}")
+                    self.logger.debug("Completed chunk %d/%d", completed, total_chunks)
                     
                 except Exception as e:
                     # Handle critical errors that should stop processing
                     if "AWS Bedrock credentials error" in str(e):
-                        # Cancel remaining futures
-                        for f in futures:
-                            f.cancel()
+                        aborted = True
                         raise e
                     else:
-                        print(f"Error in chunk processing: {e}")
+                        self.logger.error("Error in chunk processing: %s", e)
+        finally:
+            # On a credentials error, drop queued chunks and return without waiting for
+            # the in-flight ones (they fail against the same credentials anyway)
+            executor.shutdown(wait=not aborted, cancel_futures=aborted)
         
         return processed_chunks
     
@@ -362,29 +483,64 @@ class DocumentChunkingManager:
         if not processed_chunks:
             return ""
         
-        # Extract just the processed text from tuples
-        chunks_text = []
-        changes_detected = False
+        # Extract just the processed text from tuples (plain strings are accepted as-is)
+        chunks_text = [
+            chunk_data[0] if isinstance(chunk_data, tuple) else str(chunk_data)
+            for chunk_data in processed_chunks
+        ]
         
-        for chunk_data in processed_chunks:
-            if isinstance(chunk_data, tuple):
-                chunk_text, changed = chunk_data
-                chunks_text.append(chunk_text)
-                if changed:
-                    changes_detected = True
-            else:
-                # Handle case where chunk_data is just text
-                chunks_text.append(str(chunk_data))
+        # Chunks split with overlap repeat text at each boundary; drop the repeated prefix
+        if self.chunk_overlap > 0:
+            for i in range(1, len(chunks_text)):
+                overlap = self._boundary_overlap(chunks_text[i - 1], chunks_text[i], self.chunk_overlap)
+                if overlap:
+                    chunks_text[i] = chunks_text[i][overlap:]
         
-        # Simple concatenation for now - could be enhanced with overlap handling
         final_document = "".join(chunks_text)
         
-        print(f"Reassembled document from {len(chunks_text)} chunks")
-        if changes_detected:
-            print("Changes detected during chunk processing")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Reassembled document from %d chunks", len(chunks_text))
+            if any(isinstance(chunk_data, tuple) and chunk_data[1] for chunk_data in processed_chunks):
+                self.logger.info("Changes detected during chunk processing")
         
         return final_document
     
+    @staticmethod
+    def _boundary_overlap(left: str, right: str, max_overlap: int) -> int:
+        """
+        Length of the longest suffix of left that is also a prefix of right.
+        
+        Uses the KMP prefix function over right's head and left's tail, so the
+        search is linear in max_overlap. Matches shorter than MIN_STITCH_OVERLAP
+        are treated as coincidence and ignored.
+        
+        Args:
+            left: Preceding chunk
+            right: Following chunk
+            max_overlap: Longest overlap to look for (the splitter's chunk_overlap)
+            
+        Returns:
+            Number of leading characters of right repeated from left (0 if none)
+        """
+        head = right[:max_overlap]
+        tail = left[-max_overlap:]
+        combined = head + "\x00" + tail
+        
+        prefix = [0] * len(combined)
+        for i in range(1, len(combined)):
+            k = prefix[i - 1]
+            while k and combined[i] != combined[k]:
+                k = prefix[k - 1]
+            if combined[i] == combined[k]:
+                k += 1
+            prefix[i] = k
+        
+        overlap = min(prefix[-1], len(head), len(tail))
+        # Confirm directly in case the separator character occurs in the text
+        if overlap < MIN_STITCH_OVERLAP or not left.endswith(right[:overlap]):
+            return 0
+        return overlap
+    
     def validate_chunk_integrity(self, original_chunks: List[str], processed_chunks: List[str]) -> bool:
         """
         Validate that no content was lost during chunk processing.
@@ -397,18 +553,18 @@ class DocumentChunkingManager:
             True if integrity is maintained, False otherwise
         """
         if len(original_chunks) != len(processed_chunks):
-            print(f"Chunk count mismatch: {len(original_chunks)} -> {len(processed_chunks)}")
+            self.logger.warning("Chunk count mismatch: %d -> %d", len(original_chunks), len(processed_chunks))
             return False
         
         # Basic length comparison (processed chunks might be longer due to modifications)
-        original_total_length = sum(len(chunk) for chunk in original_chunks)
-        processed_total_length = sum(len(chunk) for chunk in processed_chunks)
+        original_total_length = sum(map(len, original_chunks))
+        processed_total_length = sum(map(len, processed_chunks))
         
         # Allow for reasonable size changes due to modifications
         size_change_ratio = abs(processed_total_length - original_total_length) / original_total_length
         if size_change_ratio > 0.5:  # More than 50% size change might indicate issues
-            print(f"Significant size change detected: {size_change_ratio:.2%}")
+            self.logger.warning("Significant size change detected: %.2f%%", size_change_ratio * 100)
             return False
         
-        print("Chunk integrity validation passed")
+        self.logger.info("Chunk integrity validation passed")
         return True
\ No newline at end of file
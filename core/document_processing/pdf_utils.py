@@ -5,10 +5,119 @@ Simple PDF handling utilities for Contract-Agent.
 """
 
 import fitz  # PyMuPDF
+import multiprocessing
 import os
+import threading
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
 from typing import Optional, Union
 
 
+# Page-range parallelism for long contracts; small PDFs skip the pool overhead
+PARALLEL_PAGE_THRESHOLD = 16
+MAX_EXTRACTION_WORKERS = max(1, int(os.getenv("PDF_EXTRACTION_WORKERS", min(os.cpu_count() or 1, 4))))
+
+# Pages loaded per batch before MuPDF's object store is shrunk to cap memory
+PAGE_BATCH_SIZE = 20
+
+# Plain-text extraction flags: PyMuPDF's "text" defaults keep ligatures/whitespace,
+# clip to the page's mediabox, map glyphs of fonts without a ToUnicode table via
+# their CIDs instead of U+FFFD, and never collect image blocks (only text is sent to the crew)
+TEXT_FLAGS = fitz.TEXTFLAGS_TEXT
+
+# PyMuPDF is not thread-safe (MuPDF's global context is unprotected), so in-process
+# extraction is serialized across the API's dispatcher threads. Concurrency comes
+# from worker processes instead, each with its own MuPDF context.
+MUPDF_LOCK = threading.Lock()
+
+# Page-range workers, created on first use and kept for the process lifetime. They are
+# started by a forkserver, so they are never forked from the multithreaded API process
+_extraction_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+_extraction_pool_lock = threading.Lock()
+
+
+def _get_extraction_pool(broken_pool=None) -> concurrent.futures.ProcessPoolExecutor:
+    """
+    Return the shared page-range extraction pool.
+    
+    Passing the pool that raised BrokenProcessPool replaces it, so a worker
+    crashing on one malformed PDF does not break extraction for later jobs.
+    """
+    global _extraction_pool
+    with _extraction_pool_lock:
+        if _extraction_pool is None or (broken_pool is not None and _extraction_pool is broken_pool):
+            if _extraction_pool is not None:
+                _extraction_pool.shutdown(wait=False, cancel_futures=True)
+            _extraction_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=MAX_EXTRACTION_WORKERS,
+                mp_context=multiprocessing.get_context("forkserver")
+            )
+        return _extraction_pool
+
+
+def _extract_pages(doc: fitz.Document, start: int, stop: int) -> str:
+    """
+    Extract text for pages [start, stop) of an open document.
+    
+    Pages are loaded by index in batches of PAGE_BATCH_SIZE, and MuPDF's
+    resource store is emptied between batches so very large PDFs do not
+    accumulate cached fonts/images for every page.
+    """
+    parts = []
+    for batch_start in range(start, stop, PAGE_BATCH_SIZE):
+        batch_stop = min(batch_start + PAGE_BATCH_SIZE, stop)
+        parts.extend(doc.load_page(page_num).get_text("text", flags=TEXT_FLAGS) for page_num in range(batch_start, batch_stop))
+        if batch_stop < stop:
+            fitz.TOOLS.store_shrink(100)
+    return "".join(parts)
+
+
+def _extract_page_range(file_path: str, start: int, stop: int) -> str:
+    """
+    Extract text for pages [start, stop) in a worker process.
+    
+    Each worker opens its own document handle since fitz documents
+    cannot be shared across processes.
+    """
+    with fitz.open(file_path) as doc:
+        return _extract_pages(doc, start, stop)
+
+
+def extract_pdf_text(file_path: str) -> str:
+    """
+    Extract raw text from all pages of a PDF, in page order.
+    
+    PDFs with at least PARALLEL_PAGE_THRESHOLD pages are split into
+    contiguous page ranges and extracted across the shared process pool.
+    Only in-process MuPDF work is serialized by MUPDF_LOCK, so other threads
+    keep extracting while a long PDF runs in the pool.
+    
+    Args:
+        file_path: Path to PDF file
+        
+    Returns:
+        Concatenated page text (not stripped)
+    """
+    with MUPDF_LOCK:
+        with fitz.open(file_path) as doc:
+            page_count = doc.page_count
+            if page_count < PARALLEL_PAGE_THRESHOLD or MAX_EXTRACTION_WORKERS < 2:
+                return _extract_pages(doc, 0, page_count)
+    
+    pages_per_worker = -(-page_count // MAX_EXTRACTION_WORKERS)  # ceil division
+    starts = list(range(0, page_count, pages_per_worker))
+    stops = [min(start + pages_per_worker, page_count) for start in starts]
+    
+    # Workers open their own documents in separate processes and never take MUPDF_LOCK
+    pool = _get_extraction_pool()
+    try:
+        return "".join(pool.map(_extract_page_range, [file_path] * len(starts), starts, stops))
+    except BrokenProcessPool:
+        _get_extraction_pool(broken_pool=pool)
+        raise
+
+
 def extract_text_from_pdf(file_path: str) -> Optional[str]:
     """
     Extract text content from PDF file using PyMuPDF.
@@ -23,15 +132,11 @@ def extract_text_from_pdf(file_path: str) -> Optional[str]:
         if not os.path.exists(file_path):
             return None
             
-        doc = fitz.open(file_path)
-        text_content = ""
+        # Context manager closes the document even when a page fails to parse
+        with fitz.open(file_path) as doc:
+            parts = [page.get_text("text", sort=False) for page in doc]
         
-        for page_num in range(doc.page_count):
-            page = doc[page_num]
-            text_content += page.get_text()
-            text_content += "\n\n"  # Add page separation
-        
-        doc.close()
+        text_content = "\n\n".join(parts)  # Add page separation
         return text_content.strip()
         
     except Exception as e:
@@ -39,6 +144,12 @@ def extract_text_from_pdf(file_path: str) -> Optional[str]:
         return None
 
 
+# Extension-specific extractors; every other extension is read as UTF-8 text
+EXTRACTION_HANDLERS = {
+    '.pdf': extract_text_from_pdf,
+}
+
+
 def extract_text_from_file(file_path: str) -> Optional[str]:
     """
     Extract text from various file formats.
@@ -55,15 +166,12 @@ def extract_text_from_file(file_path: str) -> Optional[str]:
     file_ext = os.path.splitext(file_path)[1].lower()
     
     try:
-        if file_ext == '.pdf':
-            return extract_text_from_pdf(file_path)
-        elif file_ext in ['.txt', '.rtf']:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read().strip()
-        else:
-            # Try to read as text file
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read().strip()
+        handler = EXTRACTION_HANDLERS.get(file_ext)
+        if handler is not None:
+            return handler(file_path)
+        
+        # .txt/.rtf and unknown extensions are read as text
+        return Path(file_path).read_text(encoding='utf-8').strip()
                 
     except Exception as e:
         print(f"Error extracting text from {file_path}: {e}")
@@ -8,6 +8,7 @@ This module contains the Actor and Critic system prompts derived from:
 """
 
 from typing import Dict, Any
+from functools import lru_cache
 import json
 
 
@@ -15,10 +16,12 @@ class SystemPrompts:
     """Container for all system prompts with variable substitution support."""
     
     @staticmethod
+    @lru_cache(maxsize=256)
     def get_actor_prompt(chunk_id: int = None, total_chunks: int = None) -> str:
         """
         Get the Actor system prompt based on nxtChat legacy implementation.
         Enhanced for chunking support when processing large documents.
+        Cached per (chunk_id, total_chunks) since every chunk task requests it.
         
         Args:
             chunk_id: Current chunk number (1-based) for chunked processing
@@ -113,6 +116,7 @@ RESPONSE FORMAT:
 - Perfect legal formatting and structure required"""
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_critic_prompt() -> str:
         """
         Get the Critic system prompt based on experiment framework evaluation logic.
@@ -7,12 +7,20 @@ performance metrics, and error patterns.
 
 import time
 import json
+import bisect
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
-from collections import defaultdict
+from collections import defaultdict, deque, OrderedDict
 import threading
 
+
+# Jobs kept for statistics; the oldest are dropped beyond this so a long-running service stays bounded
+MAX_TRACKED_JOBS = 10_000
+
+# Failed jobs remembered for get_recent_failures
+MAX_RECENT_FAILURES = 100
+
 @dataclass
 class JobMetrics:
     """Metrics for a single job"""
@@ -34,16 +42,50 @@ class PerformanceMonitor:
     """Monitor and track Contract-Agent performance metrics"""
     
     def __init__(self):
-        self.metrics: Dict[str, JobMetrics] = {}
+        self.metrics: "OrderedDict[str, JobMetrics]" = OrderedDict()
         self.error_counts = defaultdict(int)
         self.success_count = 0
         self.failure_count = 0
+        self.total_jobs = 0  # all jobs started, including ones evicted from self.metrics
+        self._recent_failures = deque(maxlen=MAX_RECENT_FAILURES)
         self.lock = threading.Lock()
         self.start_time = time.time()
         
+        # Running aggregates over self.metrics so get_statistics never rescans all jobs
+        self._processing_times: List[float] = []  # sorted, for percentiles
+        self._total_processing_time = 0.0
+        self._successful_count = 0
+        self._total_quality_score = 0.0
+        self._active_count = 0
+        
+    def _track(self, job: JobMetrics, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a job's contribution to the running aggregates"""
+        if job.status == "processing":
+            self._active_count += sign
+        if job.processing_time is None:
+            return
+        
+        if sign > 0:
+            bisect.insort(self._processing_times, job.processing_time)
+        else:
+            del self._processing_times[bisect.bisect_left(self._processing_times, job.processing_time)]
+        self._total_processing_time += sign * job.processing_time
+        
+        if job.status == "completed":
+            self._successful_count += sign
+            if job.quality_score:
+                self._total_quality_score += sign * job.quality_score
+        
     def start_job(self, job_id: str, file_size: int = 0, prompt_length: int = 0) -> None:
         """Record job start"""
         with self.lock:
+            if job_id in self.metrics:
+                self._track(self.metrics.pop(job_id), -1)
+            else:
+                self.total_jobs += 1
+                if len(self.metrics) >= MAX_TRACKED_JOBS:
+                    _, oldest = self.metrics.popitem(last=False)
+                    self._track(oldest, -1)
             self.metrics[job_id] = JobMetrics(
                 job_id=job_id,
                 start_time=time.time(),
@@ -51,14 +93,17 @@ class PerformanceMonitor:
                 file_size=file_size,
                 prompt_length=prompt_length
             )
+            self._track(self.metrics[job_id], 1)
             
     def update_job(self, job_id: str, **kwargs) -> None:
         """Update job metrics"""
         with self.lock:
             if job_id in self.metrics:
+                self._track(self.metrics[job_id], -1)
                 for key, value in kwargs.items():
                     if hasattr(self.metrics[job_id], key):
                         setattr(self.metrics[job_id], key, value)
+                self._track(self.metrics[job_id], 1)
                         
     def complete_job(self, job_id: str, success: bool, 
                     quality_score: Optional[float] = None,
@@ -68,17 +113,20 @@ class PerformanceMonitor:
         with self.lock:
             if job_id in self.metrics:
                 job = self.metrics[job_id]
+                self._track(job, -1)
                 job.end_time = time.time()
                 job.processing_time = job.end_time - job.start_time
                 job.status = "completed" if success else "failed"
                 job.quality_score = quality_score
                 job.iterations = iterations
                 job.error_message = error_message
+                self._track(job, 1)
                 
                 if success:
                     self.success_count += 1
                 else:
                     self.failure_count += 1
+                    self._recent_failures.append(job)
                     if error_message:
                         # Track error patterns
                         if "timeout" in error_message.lower():
@@ -99,7 +147,7 @@ class PerformanceMonitor:
     def get_statistics(self) -> Dict[str, Any]:
         """Get current performance statistics"""
         with self.lock:
-            total_jobs = len(self.metrics)
+            total_jobs = self.total_jobs
             if total_jobs == 0:
                 return {
                     "total_jobs": 0,
@@ -110,15 +158,14 @@ class PerformanceMonitor:
                     "uptime_hours": 0
                 }
                 
-            completed_jobs = [m for m in self.metrics.values() if m.processing_time is not None]
-            successful_jobs = [m for m in completed_jobs if m.status == "completed"]
+            processing_times = self._processing_times
+            completed_count = len(processing_times)
             
-            avg_processing_time = sum(j.processing_time for j in completed_jobs) / len(completed_jobs) if completed_jobs else 0
-            avg_quality_score = sum(j.quality_score for j in successful_jobs if j.quality_score) / len(successful_jobs) if successful_jobs else 0
+            avg_processing_time = self._total_processing_time / completed_count if completed_count else 0
+            avg_quality_score = self._total_quality_score / self._successful_count if self._successful_count else 0
             
-            # Calculate percentiles for processing time
-            if completed_jobs:
-                processing_times = sorted([j.processing_time for j in completed_jobs])
+            # Percentiles for processing time, read from the sorted running list
+            if completed_count:
                 p50_time = processing_times[len(processing_times) // 2]
                 p95_time = processing_times[int(len(processing_times) * 0.95)] if len(processing_times) > 1 else processing_times[0]
             else:
@@ -126,7 +173,7 @@ class PerformanceMonitor:
                 
             return {
                 "total_jobs": total_jobs,
-                "completed_jobs": len(completed_jobs),
+                "completed_jobs": completed_count,
                 "success_count": self.success_count,
                 "failure_count": self.failure_count,
                 "success_rate": self.success_count / total_jobs if total_jobs > 0 else 0,
@@ -136,15 +183,23 @@ class PerformanceMonitor:
                 "avg_quality_score": avg_quality_score,
                 "error_breakdown": dict(self.error_counts),
                 "uptime_hours": (time.time() - self.start_time) / 3600,
-                "active_jobs": len([m for m in self.metrics.values() if m.status == "processing"])
+                "active_jobs": self._active_count
             }
             
     def get_recent_failures(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent failed jobs for debugging"""
         with self.lock:
-            failed_jobs = [m for m in self.metrics.values() if m.status == "failed"]
-            failed_jobs.sort(key=lambda x: x.start_time, reverse=True)
-            return [asdict(job) for job in failed_jobs[:limit]]
+            # Most recently failed first; skip jobs restarted or completed again since, or listed twice
+            failures = []
+            seen = set()
+            for job in reversed(self._recent_failures):
+                if len(failures) >= limit:
+                    break
+                current = self.metrics.get(job.job_id, job) is job
+                if current and job.status == "failed" and job.job_id not in seen:
+                    seen.add(job.job_id)
+                    failures.append(asdict(job))
+            return failures
             
     def export_metrics(self, filepath: str) -> None:
         """Export metrics to JSON file"""
@@ -164,8 +219,15 @@ class PerformanceMonitor:
         with self.lock:
             self.metrics.clear()
             self.error_counts.clear()
+            self._processing_times.clear()
+            self._total_processing_time = 0.0
+            self._successful_count = 0
+            self._total_quality_score = 0.0
+            self._active_count = 0
             self.success_count = 0
             self.failure_count = 0
+            self.total_jobs = 0
+            self._recent_failures.clear()
             self.start_time = time.time()
 
 
@@ -4,36 +4,75 @@ Test Data Conversion Script
 Converts all test data files to txt format with 1000 line limit
 """
 
+import importlib
 import os
 import sys
 from pathlib import Path
 import subprocess
 import logging
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 1 MiB output buffer so each converted file is flushed in one write
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Conversion dependencies as (import name, pip package)
+DEPENDENCIES = [
+    ('pdfplumber', 'pdfplumber'),
+    ('docx', 'python-docx'),
+]
+
 def setup_dependencies():
-    """Install required dependencies for file conversion"""
-    try:
-        # Check if pdfplumber is available
-        import pdfplumber
-        logger.info("✅ pdfplumber is available")
-    except ImportError:
-        logger.info("Installing pdfplumber...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "pdfplumber"])
-        import pdfplumber
+    """
+    Check that the conversion dependencies are importable.
     
-    try:
-        # Check if python-docx is available
-        import docx
-        logger.info("✅ python-docx is available")
-    except ImportError:
-        logger.info("Installing python-docx...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "python-docx"])
-        import docx
+    Missing packages are only installed when AUTOINSTALL=1; otherwise the script
+    exits with instructions instead of running pip on every cold start.
+    """
+    missing = []
+    for module_name, package_name in DEPENDENCIES:
+        try:
+            importlib.import_module(module_name)
+            logger.info(f"✅ {package_name} is available")
+        except ImportError:
+            missing.append(package_name)
+    
+    if not missing:
+        return
+    
+    if os.environ.get("AUTOINSTALL") != "1":
+        requirements = Path(__file__).parent / "requirements.txt"
+        raise SystemExit(
+            f"❌ Missing conversion dependencies: {', '.join(missing)}. "
+            f"Install them with: pip install -r {requirements} "
+            "(or rerun with AUTOINSTALL=1)"
+        )
+    
+    logger.info(f"Installing {', '.join(missing)}...")
+    subprocess.check_call([sys.executable, "-m", "pip", "install", *missing])
+
+def _write_lines(output_path: Path, text_lines: List[str]) -> None:
+    """Write newline-terminated lines to output_path in a single buffered write"""
+    with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        if text_lines:
+            f.write('\n'.join(text_lines) + '\n')
+
+def _collect_lines(text: str, text_lines: List[str], line_limit: int) -> bool:
+    """
+    Append the lines of text to text_lines without exceeding line_limit.
+    
+    Returns:
+        True once line_limit lines have been collected
+    """
+    for line in text.split('\n'):
+        if len(text_lines) >= line_limit:
+            return True
+        text_lines.append(line)
+    return len(text_lines) >= line_limit
 
 def convert_pdf_to_txt(pdf_path: Path, output_path: Path, line_limit: int = 1000) -> bool:
     """Convert PDF to TXT with line limit"""
@@ -44,22 +83,17 @@ def convert_pdf_to_txt(pdf_path: Path, output_path: Path, line_limit: int = 1000
         text_lines = []
         
         with pdfplumber.open(pdf_path) as pdf:
+            # Stop before extracting further pages once the limit is reached
             for page in pdf.pages:
                 page_text = page.extract_text()
-                if page_text:
-                    # Split by lines and add to our collection
-                    lines = page_text.split('\n')
-                    text_lines.extend(lines)
-                    
-                # Check if we've reached our line limit
-                if len(text_lines) >= line_limit:
-                    text_lines = text_lines[:line_limit]
+                # Image-only and blank pages add no lines
+                if not page_text:
+                    continue
+                if _collect_lines(page_text, text_lines, line_limit):
                     break
         
         # Write to output file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            for line in text_lines:
-                f.write(line + '\n')
+        _write_lines(output_path, text_lines)
         
         logger.info(f"✅ Converted {pdf_path.name} -> {output_path.name} ({len(text_lines)} lines)")
         return True
@@ -79,18 +113,11 @@ def convert_docx_to_txt(docx_path: Path, output_path: Path, line_limit: int = 10
         
         for paragraph in doc.paragraphs:
             # Split paragraph text by lines if it contains line breaks
-            para_lines = paragraph.text.split('\n')
-            text_lines.extend(para_lines)
-            
-            # Check if we've reached our line limit
-            if len(text_lines) >= line_limit:
-                text_lines = text_lines[:line_limit]
+            if _collect_lines(paragraph.text, text_lines, line_limit):
                 break
         
         # Write to output file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            for line in text_lines:
-                f.write(line + '\n')
+        _write_lines(output_path, text_lines)
         
         logger.info(f"✅ Converted {docx_path.name} -> {output_path.name} ({len(text_lines)} lines)")
         return True
@@ -111,7 +138,7 @@ def limit_txt_file(txt_path: Path, output_path: Path, line_limit: int = 1000) ->
         limited_lines = lines[:line_limit]
         
         # Write to output file
-        with open(output_path, 'w', encoding='utf-8') as f:
+        with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
             f.writelines(limited_lines)
         
         logger.info(f"✅ Limited {txt_path.name} -> {output_path.name} ({len(limited_lines)} lines, original: {len(lines)} lines)")
@@ -121,6 +148,18 @@ def limit_txt_file(txt_path: Path, output_path: Path, line_limit: int = 1000) ->
         logger.error(f"❌ Failed to process {txt_path.name}: {str(e)}")
         return False
 
+# Converter for each supported input extension
+CONVERTERS = {
+    '.pdf': convert_pdf_to_txt,
+    '.docx': convert_docx_to_txt,
+    '.txt': limit_txt_file,
+}
+
+def _convert_file(job) -> Tuple[str, bool]:
+    """Run one (converter, input, output, line_limit) job in a worker process"""
+    converter, file_path, output_path, line_limit = job
+    return file_path.name, converter(file_path, output_path, line_limit)
+
 def convert_all_files(test_data_dir: Path, line_limit: int = 1000):
     """Convert all files in test data directory to txt format"""
     
@@ -139,8 +178,9 @@ def convert_all_files(test_data_dir: Path, line_limit: int = 1000):
         'skipped': []
     }
     
-    # Process all files in the directory
-    for file_path in test_data_dir.iterdir():
+    # Collect conversion work for all files in the directory
+    work = []
+    for file_path in sorted(test_data_dir.iterdir()):
         if not file_path.is_file():
             continue
             
@@ -154,22 +194,25 @@ def convert_all_files(test_data_dir: Path, line_limit: int = 1000):
         output_path = converted_dir / output_name
         
         # Convert based on file extension
-        success = False
-        if file_path.suffix.lower() == '.pdf':
-            success = convert_pdf_to_txt(file_path, output_path, line_limit)
-        elif file_path.suffix.lower() == '.docx':
-            success = convert_docx_to_txt(file_path, output_path, line_limit)
-        elif file_path.suffix.lower() == '.txt':
-            success = limit_txt_file(file_path, output_path, line_limit)
-        else:
+        converter = CONVERTERS.get(file_path.suffix.lower())
+        if converter is None:
             logger.warning(f"⚠️ Unsupported file type: {file_path.name}")
             results['skipped'].append(file_path.name)
             continue
         
-        if success:
-            results['success'].append(file_path.name)
-        else:
-            results['failed'].append(file_path.name)
+        work.append((converter, file_path, output_path, line_limit))
+    
+    # Files are independent and parsing is CPU-bound, so convert them across processes;
+    # batching several files per task keeps pickling overhead low
+    if work:
+        max_workers = min(len(work), os.cpu_count() or 1)
+        chunksize = max(1, len(work) // (max_workers + 2))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for file_name, success in executor.map(_convert_file, work, chunksize=chunksize):
+                if success:
+                    results['success'].append(file_name)
+                else:
+                    results['failed'].append(file_name)
     
     # Print summary
     logger.info("\n" + "="*60)
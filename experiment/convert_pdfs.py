@@ -62,15 +62,15 @@ def convert_pdf_to_rtf(pdf_path: Path, rtf_path: Path) -> bool:
     
     # Extract text from PDF using PyMuPDF
     try:
-        doc = fitz.open(str(pdf_path))
         text_content = ""
         
-        for page_num in range(doc.page_count):
-            page = doc[page_num]
-            text_content += page.get_text()
-            text_content += "\n\n"  # Add page separation
+        # Context manager closes the document even when a page fails to parse
+        with fitz.open(str(pdf_path)) as doc:
+            for page_num in range(doc.page_count):
+                page = doc[page_num]
+                text_content += page.get_text()
+                text_content += "\n\n"  # Add page separation
         
-        doc.close()
         text = text_content.strip()
         
         if not text:
@@ -13,6 +13,8 @@ import json
 import time
 import logging
 import os
+import threading
+from collections import deque
 from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
@@ -44,6 +46,42 @@ class BedrockResponse:
     error_message: Optional[str] = None
 
 
+class RequestRateLimiter:
+    """
+    Sliding-window limiter on how many Bedrock requests start per minute.
+
+    Shared across threads, so the request rate stays within the account quota
+    independently of how many workers are submitting.
+    """
+    
+    def __init__(self, requests_per_minute: int = 0, period_seconds: float = 60.0):
+        """
+        Args:
+            requests_per_minute: Requests allowed per period (0 disables limiting)
+            period_seconds: Length of the sliding window
+        """
+        self.requests_per_minute = requests_per_minute
+        self.period_seconds = period_seconds
+        self._started = deque()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until another request may start within the window"""
+        if self.requests_per_minute <= 0:
+            return
+        
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._started and now - self._started[0] >= self.period_seconds:
+                    self._started.popleft()
+                if len(self._started) < self.requests_per_minute:
+                    self._started.append(now)
+                    return
+                wait = self.period_seconds - (now - self._started[0])
+            time.sleep(wait)
+
+
 class BedrockModelManager:
     """
     Manages AWS Bedrock model interactions with retry logic and error handling.
@@ -79,6 +117,16 @@ class BedrockModelManager:
     # Request timeout configurations for large contracts
     REQUEST_TIMEOUT_SECONDS = 600  # 10 minutes for large document processing
     
+    # Bedrock inference latency profiles ("optimized" needs a supported model/region)
+    PERFORMANCE_LATENCIES = ("standard", "optimized")
+    
+    # Model families offering latency-optimized inference; others always run "standard"
+    LATENCY_OPTIMIZED_MODEL_PREFIXES = (
+        "amazon.nova-pro", "us.amazon.nova-pro",
+        "anthropic.claude-3-5-haiku", "us.anthropic.claude-3-5-haiku",
+        "meta.llama3-1-", "us.meta.llama3-1-",
+    )
+    
     def __init__(self, 
                  region_name: Optional[str] = None,
                  max_concurrent_requests: Optional[int] = None,
@@ -130,6 +178,36 @@ class BedrockModelManager:
         # Model selection preferences from environment variables
         self.primary_model = os.getenv('CONTRACT_PRIMARY_MODEL', self.MODELS["nova_pro"])
         self.fallback_model = os.getenv('CONTRACT_FALLBACK_MODEL', self.MODELS["mistral_large"])
+        
+        # Latency-optimized inference is opt-in per deployment
+        self.performance_latency = "standard"
+        self.set_performance_config(os.getenv('BEDROCK_PERFORMANCE_LATENCY', 'standard'))
+    
+    def set_performance_config(self, latency: str) -> None:
+        """
+        Select the Bedrock inference latency profile for subsequent invocations
+        
+        Args:
+            latency: "standard" or "optimized" (latency-optimized inference, only
+                available for some models and regions)
+        """
+        if latency not in self.PERFORMANCE_LATENCIES:
+            raise ValueError(f"Unsupported performance latency: {latency}")
+        self.performance_latency = latency
+    
+    @classmethod
+    def supports_latency_optimized(cls, model_id: str) -> bool:
+        """Whether Bedrock offers latency-optimized inference for this model"""
+        return model_id.startswith(cls.LATENCY_OPTIMIZED_MODEL_PREFIXES)
+    
+    def performance_latency_for(self, model_id: str) -> str:
+        """
+        Latency profile to request for a model: the configured profile, falling back
+        to "standard" for models without latency-optimized inference
+        """
+        if self.performance_latency == "optimized" and not self.supports_latency_optimized(model_id):
+            return "standard"
+        return self.performance_latency
     
     def get_model_for_task(self, task_complexity: TaskComplexity, 
                           document_length: int = 0) -> str:
@@ -258,7 +336,8 @@ class BedrockModelManager:
                     modelId=model_id,
                     body=request_body,
                     contentType="application/json",
-                    accept="application/json"
+                    accept="application/json",
+                    performanceConfigLatency=self.performance_latency_for(model_id)
                 )
                 
                 # Parse response
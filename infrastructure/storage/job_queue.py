@@ -0,0 +1,100 @@
+"""
+Contract Assistant vNext - Job Queue
+
+Lightweight dispatch queue for handing contract jobs from Flask request
+threads to the background processing thread.
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Optional
+
+
+class JobQueue:
+    """
+    Multi-producer job queue backed by a deque and an Event.
+
+    deque.append/popleft are atomic, so unbounded producers never take a lock;
+    the Event only wakes the consumer when the queue was drained.
+    Mirrors the queue.Queue put/put_nowait/get/qsize/full interface used by the API server.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        """
+        Args:
+            maxsize: Capacity enforced by put_nowait (0 means unbounded)
+        """
+        self.maxsize = maxsize
+        self._items = deque()
+        self._ready = threading.Event()
+        self._put_lock = threading.Lock()
+
+    def put(self, item: Any) -> None:
+        """Enqueue a job and wake the consumer"""
+        self._items.append(item)
+        self._ready.set()
+
+    def put_nowait(self, item: Any) -> None:
+        """
+        Enqueue a job unless the queue is at capacity.
+
+        Raises:
+            queue.Full: If maxsize jobs are already queued
+        """
+        if self.maxsize <= 0:
+            self.put(item)
+            return
+
+        # Serialize the capacity check so concurrent producers cannot overshoot maxsize
+        with self._put_lock:
+            if len(self._items) >= self.maxsize:
+                raise queue.Full
+            self.put(item)
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """
+        Dequeue the oldest job.
+
+        Args:
+            block: Wait for a job if the queue is empty
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            The oldest queued item
+
+        Raises:
+            queue.Empty: If no job became available
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            try:
+                return self._items.popleft()
+            except IndexError:
+                pass
+
+            # Clear then re-check so a put() racing with clear() is never lost
+            self._ready.clear()
+            if self._items:
+                continue
+
+            if not block:
+                raise queue.Empty
+
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise queue.Empty
+            self._ready.wait(remaining)
+
+    def qsize(self) -> int:
+        """Approximate number of queued jobs"""
+        return len(self._items)
+
+    def full(self) -> bool:
+        """Whether put_nowait would currently be rejected"""
+        return 0 < self.maxsize <= len(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
@@ -30,6 +30,7 @@ class JobData:
     result: Optional[CrewProcessingResult] = None
     progress: int = 0  # 0-100
     error_message: Optional[str] = None
+    file_path: Optional[str] = None  # On-disk upload when file_data is not held in memory
 
 
 class MemoryStorage:
@@ -65,18 +66,20 @@ class MemoryStorage:
             self.logger.info("Session-based cleanup enabled - automatic cleanup disabled")
     
     def create_job(self, 
-                   file_data: bytes, 
+                   file_data: Optional[bytes], 
                    filename: str, 
                    user_prompt: str, 
-                   job_id: str = None) -> str:
+                   job_id: str = None,
+                   file_path: Optional[str] = None) -> str:
         """
         Create a new job and store file in memory.
         
         Args:
-            file_data: Binary file content
+            file_data: Binary file content (None when the upload stays on disk)
             filename: Original filename
             user_prompt: User instructions for processing
             job_id: Optional custom job ID
+            file_path: Path of the saved upload, used instead of file_data for large files
             
         Returns:
             Job ID for tracking processing
@@ -93,7 +96,8 @@ class MemoryStorage:
                 status="queued",
                 created_at=datetime.now(),
                 updated_at=datetime.now(),
-                progress=0
+                progress=0,
+                file_path=file_path
             )
             
             self.storage[job_id] = job_data
@@ -256,10 +260,10 @@ class MemoryStorage:
         import os
         import glob
         
-        # Get script directory and define paths
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        upload_folder = os.path.join(script_dir, "uploaded_docs")
-        rtf_folder = os.path.join(script_dir, "generated_rtf")
+        # Resolve the API server's data folders (data/uploads and data/generated at the project root)
+        project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        upload_folder = os.path.join(project_root, "data", "uploads")
+        rtf_folder = os.path.join(project_root, "data", "generated")
         
         cleaned_files = []
         
@@ -447,9 +451,10 @@ def get_memory_storage() -> MemoryStorage:
     """Get the global memory storage instance"""
     return _memory_storage
 
-def create_job(file_data: bytes, filename: str, user_prompt: str, job_id: str = None) -> str:
+def create_job(file_data: Optional[bytes], filename: str, user_prompt: str, job_id: str = None,
+               file_path: Optional[str] = None) -> str:
     """Convenience function to create a job"""
-    return _memory_storage.create_job(file_data, filename, user_prompt, job_id)
+    return _memory_storage.create_job(file_data, filename, user_prompt, job_id, file_path)
 
 def get_job_status(job_id: str) -> Optional[Dict[str, Any]]:
     """Convenience function to get job status"""
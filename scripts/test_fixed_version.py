@@ -137,7 +137,8 @@ if __name__ == "__main__":
         if health_response.status_code == 200:
             health = health_response.json()
             print(f"✅ Health check passed: {health['status']}")
-            print(f"   Performance metrics available: {bool(health.get('performance_metrics'))}")
+            metrics_response = requests.get(f"{API_BASE_URL}/metrics", timeout=5)
+            print(f"   Performance metrics available: {metrics_response.status_code == 200}")
         else:
             print(f"❌ Health check failed: HTTP {health_response.status_code}")
             exit(1)
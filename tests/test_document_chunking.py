@@ -7,8 +7,44 @@ and parallel processing with various contract document types and instruction pat
 
 import pytest
 import os
+import random
 from unittest.mock import Mock, patch
-from document_chunking import DocumentChunkingManager
+from document_chunking import DocumentChunkingManager, STRUCTURE_MARKERS
+
+
+def naive_occurrences(doc_lower, needle):
+    """Reference scan: repeated str.find, resuming after each match"""
+    positions = []
+    start_pos = doc_lower.find(needle)
+    while start_pos != -1:
+        positions.append(start_pos)
+        start_pos = doc_lower.find(needle, start_pos + len(needle))
+    return positions
+
+
+def naive_chunk_score(chunk, targets):
+    """Reference chunk score using plain substring checks, as prioritize_chunks scores"""
+    score = 0
+    chunk_lower = chunk.lower()
+    for target in targets:
+        target_lower = target.lower()
+        if target_lower in chunk_lower:
+            score += 5
+            target_pos = chunk_lower.find(target_lower)
+            if target_pos < len(chunk) // 3:
+                score += 2
+            elif target_pos < len(chunk) * 2 // 3:
+                score += 1
+        elif len(target_lower) > 10:
+            half = len(target_lower) // 2
+            if target_lower[:half] in chunk_lower:
+                score += 2
+            if target_lower[half:] in chunk_lower:
+                score += 2
+    for marker in STRUCTURE_MARKERS:
+        if marker in chunk_lower:
+            score += 1
+    return score
 
 
 class TestDocumentChunkingManager:
@@ -188,8 +224,8 @@ class TestDocumentChunkingManager:
     def test_initialization(self):
         """Test DocumentChunkingManager initialization"""
         manager = DocumentChunkingManager()
-        assert manager.chunk_size == 25000
-        assert manager.chunk_overlap == 5000
+        assert manager.chunk_size == 100000
+        assert manager.chunk_overlap == 0
         assert manager.text_splitter is not None
         
         # Test custom initialization
@@ -237,6 +273,28 @@ class TestDocumentChunkingManager:
         # Due to overlap, reassembled might be longer, but should contain original content
         assert len(reassembled) >= len(self.large_contract)
     
+    def test_split_document_boundaries_without_overlap(self):
+        """Test that chunks split on paragraph boundaries and rejoin to the exact original"""
+        manager = DocumentChunkingManager(chunk_size=1000)
+        paragraphs = [
+            f"{i}. The Company shall pay the Consultant the fees set out in Schedule {i}. "
+            f"Payment is due within thirty days of invoice."
+            for i in range(1, 61)
+        ]
+        document = "\n\n".join(paragraphs)
+        
+        chunks = manager.split_document(document)
+        
+        assert len(chunks) > 1
+        # No overlap and no stripped whitespace: concatenation reproduces the document
+        assert "".join(chunks) == document
+        assert sum(len(chunk) for chunk in chunks) == len(document)
+        for chunk in chunks:
+            assert len(chunk) <= manager.chunk_size
+        # Every split falls on a paragraph break, never inside a clause
+        for chunk in chunks[1:]:
+            assert chunk.startswith("\n\n")
+    
     def test_find_instruction_targets_quoted_text(self):
         """Test target identification with quoted text"""
         instruction = self.instructions["quoted_text"]
@@ -285,6 +343,57 @@ class TestDocumentChunkingManager:
         target_text = " ".join(targets).lower()
         assert "hash blockchain" in target_text or "company" in target_text
     
+    def test_find_all_occurrences_matches_naive_scan(self):
+        """Test that the single Aho-Corasick scan finds the same positions as repeated str.find"""
+        document = "Termination: either party may TERMINATE this term; terms of termination apply. aaaaa"
+        doc_lower = document.lower()
+        # Overlapping, nested, self-overlapping and absent needles
+        needles = ["term", "termination", "terminate", "terms", "aa", "aaa", "arbitration"]
+        
+        occurrences = DocumentChunkingManager._find_all_occurrences(doc_lower, needles)
+        
+        for needle in needles:
+            assert occurrences[needle] == naive_occurrences(doc_lower, needle)
+        assert occurrences["aa"] == [79, 81]
+        assert occurrences["arbitration"] == []
+        
+        # Randomized documents over a small alphabet produce many overlapping matches
+        rng = random.Random(0)
+        for _ in range(200):
+            doc_lower = "".join(rng.choice("ab c") for _ in range(rng.randint(0, 80)))
+            needles = list({"".join(rng.choice("ab c") for _ in range(rng.randint(1, 4))) for _ in range(6)})
+            occurrences = DocumentChunkingManager._find_all_occurrences(doc_lower, needles)
+            for needle in needles:
+                assert occurrences[needle] == naive_occurrences(doc_lower, needle)
+    
+    def test_find_instruction_targets_case_insensitive(self):
+        """Test that targets are matched regardless of case and keep the document's own text"""
+        instruction = 'Replace "HASH BLOCKCHAIN LIMITED" with "Digital Finance Corp"'
+        
+        targets = self.chunking_manager.find_instruction_targets(instruction, self.small_contract)
+        
+        assert len(targets) > 0
+        assert any("Hash Blockchain Limited" in target for target in targets)
+        assert all(target in self.small_contract for target in targets)
+    
+    def test_prioritize_chunks_matches_naive_scoring(self):
+        """Test that automaton-based prioritization matches scoring with plain substring checks"""
+        manager = DocumentChunkingManager(chunk_size=2000)
+        instruction = self.instructions["domicile_shift"]
+        targets = manager.find_instruction_targets(instruction, self.large_contract)
+        chunks = manager.split_document(self.large_contract)
+        assert targets and len(chunks) > 1
+        
+        scores = [naive_chunk_score(chunk, targets) for chunk in chunks]
+        expected = sorted(range(len(chunks)), key=lambda i: (-scores[i], i))
+        
+        assert manager.prioritize_chunk_indices(chunks, targets) == expected
+        assert manager.prioritize_chunks(chunks, targets) == [chunks[i] for i in expected]
+        # chunk_overlaps_targets agrees with the scan: any target or half-target hit scores above markers alone
+        for chunk in chunks:
+            marker_score = sum(1 for marker in STRUCTURE_MARKERS if marker in chunk.lower())
+            assert manager.chunk_overlaps_targets(chunk, targets) == (naive_chunk_score(chunk, targets) > marker_score)
+    
     def test_prioritize_chunks_no_targets(self):
         """Test chunk prioritization with no targets"""
         chunks = ["chunk1", "chunk2", "chunk3"]
@@ -417,6 +526,54 @@ class TestDocumentChunkingManager:
         result = self.chunking_manager.reassemble_chunks([])
         assert result == ""
     
+    def test_reassemble_chunks_exact_overlap(self):
+        """Test that a chunk_overlap-long repeated boundary is stitched out"""
+        manager = DocumentChunkingManager(chunk_size=1000, chunk_overlap=64)
+        shared = "The Consultant shall deliver the reports described in Exhibit B. "
+        shared = shared[:64]
+        left = "1. SERVICES\n" + shared
+        right = shared + "2. COMPENSATION\n"
+        
+        result = manager.reassemble_chunks([(left, False), (right, True)])
+        
+        assert result == "1. SERVICES\n" + shared + "2. COMPENSATION\n"
+    
+    def test_reassemble_chunks_partial_overlap(self):
+        """Test that an overlap shorter than chunk_overlap is stitched out"""
+        manager = DocumentChunkingManager(chunk_size=1000, chunk_overlap=200)
+        shared = "Payment is due within thirty days of invoice receipt."
+        left = "3. PAYMENT\nCompany shall pay all fees. " + shared
+        right = shared + "\n\n4. TERM\n"
+        
+        result = manager.reassemble_chunks([(left, False), (right, False)])
+        
+        assert result == left + "\n\n4. TERM\n"
+    
+    def test_reassemble_chunks_no_overlap(self):
+        """Test that chunks without a repeated boundary are concatenated unchanged"""
+        manager = DocumentChunkingManager(chunk_size=1000, chunk_overlap=64)
+        left = "1. SERVICES\nConsultant shall provide development services."
+        right = "\n\n2. COMPENSATION\nCompany shall pay $10,000 per month."
+        # Coincidental matches shorter than MIN_STITCH_OVERLAP are kept
+        short_left = "governed by the laws of Hong Kong"
+        short_right = "Hong Kong arbitration applies."
+        
+        assert manager.reassemble_chunks([(left, False), (right, False)]) == left + right
+        assert manager.reassemble_chunks([short_left, short_right]) == short_left + short_right
+    
+    def test_split_and_reassemble_with_overlap(self):
+        """Test that overlapping chunks from the splitter reassemble to the original document"""
+        manager = DocumentChunkingManager(chunk_size=1000, chunk_overlap=100)
+        document = " ".join(
+            f"Clause {i} provides that the Company shall pay the Consultant promptly."
+            for i in range(300)
+        )
+        
+        chunks = manager.split_document(document)
+        
+        assert sum(len(chunk) for chunk in chunks) > len(document)
+        assert manager.reassemble_chunks([(chunk, False) for chunk in chunks]) == document
+    
     def test_validate_chunk_integrity_success(self):
         """Test successful chunk integrity validation"""
         original_chunks = ["chunk1", "chunk2", "chunk3"]
@@ -0,0 +1,139 @@
+"""
+Test suite for JobQueue
+
+Tests FIFO dispatch, the bounded put_nowait used for 429 responses,
+and blocking get behaviour between producer and consumer threads.
+"""
+
+import os
+import queue
+import sys
+import threading
+import time
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infrastructure.storage.job_queue import JobQueue
+
+
+class TestJobQueue:
+    """Test suite for JobQueue functionality"""
+    
+    def test_fifo_order(self):
+        """Test that jobs are dequeued in the order they were queued"""
+        job_queue = JobQueue()
+        for i in range(5):
+            job_queue.put(f"job-{i}")
+        
+        assert job_queue.qsize() == 5
+        assert [job_queue.get(block=False) for _ in range(5)] == [f"job-{i}" for i in range(5)]
+        assert len(job_queue) == 0
+    
+    def test_put_nowait_rejects_when_full(self):
+        """Test that put_nowait raises queue.Full once maxsize jobs are queued"""
+        job_queue = JobQueue(maxsize=2)
+        job_queue.put_nowait("job-1")
+        job_queue.put_nowait("job-2")
+        
+        assert job_queue.full()
+        with pytest.raises(queue.Full):
+            job_queue.put_nowait("job-3")
+        assert job_queue.qsize() == 2
+        
+        # Draining one job frees a slot again
+        assert job_queue.get(block=False) == "job-1"
+        assert not job_queue.full()
+        job_queue.put_nowait("job-3")
+        assert [job_queue.get(block=False), job_queue.get(block=False)] == ["job-2", "job-3"]
+    
+    def test_unbounded_queue_never_full(self):
+        """Test that maxsize 0 accepts any number of jobs"""
+        job_queue = JobQueue(maxsize=0)
+        for i in range(100):
+            job_queue.put_nowait(i)
+        
+        assert not job_queue.full()
+        assert job_queue.qsize() == 100
+    
+    def test_concurrent_put_nowait_respects_maxsize(self):
+        """Test that concurrent producers cannot overshoot maxsize"""
+        job_queue = JobQueue(maxsize=10)
+        accepted = []
+        rejected = []
+        
+        def producer(worker_id):
+            for i in range(20):
+                try:
+                    job_queue.put_nowait((worker_id, i))
+                    accepted.append((worker_id, i))
+                except queue.Full:
+                    rejected.append((worker_id, i))
+        
+        threads = [threading.Thread(target=producer, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(accepted) == 10
+        assert len(rejected) == 150
+        assert job_queue.qsize() == 10
+    
+    def test_get_nonblocking_empty(self):
+        """Test that a non-blocking get on an empty queue raises queue.Empty"""
+        job_queue = JobQueue()
+        with pytest.raises(queue.Empty):
+            job_queue.get(block=False)
+    
+    def test_get_timeout_empty(self):
+        """Test that a blocking get gives up after its timeout"""
+        job_queue = JobQueue()
+        start = time.monotonic()
+        with pytest.raises(queue.Empty):
+            job_queue.get(timeout=0.1)
+        assert time.monotonic() - start >= 0.1
+    
+    def test_blocking_get_woken_by_put(self):
+        """Test that a consumer blocked in get is woken by a later put"""
+        job_queue = JobQueue()
+        received = []
+        
+        consumer = threading.Thread(target=lambda: received.append(job_queue.get(timeout=5)))
+        consumer.start()
+        
+        # Let the consumer drain the queue and wait on the event before producing
+        time.sleep(0.1)
+        assert consumer.is_alive()
+        job_queue.put("job-1")
+        consumer.join(timeout=2)
+        
+        assert not consumer.is_alive()
+        assert received == ["job-1"]
+    
+    def test_blocking_consumers_receive_every_job(self):
+        """Test that several blocked consumers together receive each job exactly once"""
+        job_queue = JobQueue()
+        received = []
+        received_lock = threading.Lock()
+        
+        def consumer():
+            while True:
+                try:
+                    job = job_queue.get(timeout=1)
+                except queue.Empty:
+                    return
+                with received_lock:
+                    received.append(job)
+        
+        consumers = [threading.Thread(target=consumer) for _ in range(4)]
+        for thread in consumers:
+            thread.start()
+        for i in range(200):
+            job_queue.put(i)
+        for thread in consumers:
+            thread.join(timeout=5)
+        
+        assert sorted(received) == list(range(200))